@@ -1,4 +1,5 @@
 import tkinter as tk
+from calc_engine import evaluate as evaluate_expr, format_result
 
 def button_click(number):
     current = display_var.get()
@@ -6,8 +7,8 @@ def button_click(number):
 
 def evaluate():
     try:
-        result = eval(display_var.get())
-        display_var.set(result)
+        result = evaluate_expr(display_var.get())
+        display_var.set(format_result(result))
     except Exception:
         display_var.set("Error")
 
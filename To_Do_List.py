@@ -1,8 +1,27 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import time
+import queue
+import threading
 
 TASKS_FILE = "tasks.txt"
+SNAPSHOT_TMP = TASKS_FILE + ".tmp"
+JOURNAL_FILE = TASKS_FILE + ".journal"
+COMPACTING_FILE = JOURNAL_FILE + ".compacting"
+COMPACT_EVERY = 500
+AUTOSAVE_DELAY_MS = 750
+AUTOSAVE_MAX_DELAY_MS = 3000
+
+journal = None
+journal_ops = 0
+pending_ops = []
+first_pending_at = None
+autosave_job = None
+needs_snapshot = False
+snapshots_blocked = False
+save_queue = queue.Queue()
+save_errors = queue.Queue()
 
 def add_task(event=None):
     task = task_var.get().strip()
@@ -10,6 +29,7 @@ def add_task(event=None):
         status_var.set("⚠️ Please enter a task.")
         return
     task_listbox.insert(tk.END, task)
+    log_ops([("A", task)])
     task_var.set("")
     status_var.set("Task added ✓")
 
@@ -20,6 +40,7 @@ def delete_task(event=None):
         return
     for index in reversed(sel):
         task_listbox.delete(index)
+    log_ops([("D", index) for index in reversed(sel)])
     status_var.set("Task deleted ✓")
 
 def clear_all():
@@ -28,101 +49,248 @@ def clear_all():
         return
     if messagebox.askyesno("Clear All", "Delete all tasks?"):
         task_listbox.delete(0, tk.END)
+        log_ops([("C", "")])
         status_var.set("All tasks cleared.")
 
 def on_double_click(event):
     delete_task()
 
-def load_tasks():
-    if not os.path.exists(TASKS_FILE):
-        return
-    try:
+def replay_journal(path, tasks):
+    count = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            op, _, arg = line[:-1].partition("\t")
+            if op == "A":
+                tasks.append(arg)
+            elif op == "D":
+                index = int(arg)
+                if 0 <= index < len(tasks):
+                    del tasks[index]
+            elif op == "C":
+                tasks.clear()
+            count += 1
+    return count
+
+def read_tasks():
+    tasks = []
+    if os.path.exists(TASKS_FILE):
         with open(TASKS_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.rstrip("\n")
-                if line:
-                    task_listbox.insert(tk.END, line)
-    except Exception:
-        pass
+            tasks = [line for line in f.read().split("\n") if line]
+    journals = [JOURNAL_FILE]
+    if os.path.exists(COMPACTING_FILE) and os.path.exists(SNAPSHOT_TMP):
+        journals.insert(0, COMPACTING_FILE)
+    ops = 0
+    for path in journals:
+        if os.path.exists(path):
+            ops += replay_journal(path, tasks)
+    return tasks, ops
 
-def save_tasks():
+def open_journal():
+    global journal
+    journal = open(JOURNAL_FILE, "a", encoding="utf-8")
+
+def write_ops(ops):
+    if journal is None or journal.closed:
+        open_journal()
+    journal.write("".join(f"{op}\t{arg}\n" for op, arg in ops))
+    journal.flush()
+    os.fsync(journal.fileno())
+
+def write_snapshot(tasks):
+    with open(SNAPSHOT_TMP, "w", encoding="utf-8") as f:
+        f.write("".join(task + "\n" for task in tasks))
+        f.flush()
+        os.fsync(f.fileno())
+    journal.close()
     try:
-        with open(TASKS_FILE, "w", encoding="utf-8") as f:
-            for i in range(task_listbox.size()):
-                f.write(task_listbox.get(i) + "\n")
-    except Exception:
+        if os.path.exists(JOURNAL_FILE):
+            os.replace(JOURNAL_FILE, COMPACTING_FILE)
+        os.replace(SNAPSHOT_TMP, TASKS_FILE)
+        if os.path.exists(COMPACTING_FILE):
+            os.remove(COMPACTING_FILE)
+    finally:
+        open_journal()
+
+def save_worker():
+    while True:
+        job = save_queue.get()
+        try:
+            if job is None:
+                if journal is not None:
+                    journal.close()
+                return
+            ops, snapshot = job
+            if ops:
+                write_ops(ops)
+            if snapshot is not None:
+                write_snapshot(snapshot)
+        except Exception as e:
+            save_errors.put(str(e) or type(e).__name__)
+        finally:
+            save_queue.task_done()
+
+def log_ops(entries):
+    global first_pending_at, autosave_job
+    pending_ops.extend(entries)
+    now = time.monotonic()
+    if first_pending_at is None:
+        first_pending_at = now
+    if autosave_job is not None:
+        root.after_cancel(autosave_job)
+        autosave_job = None
+    if (now - first_pending_at) * 1000 >= AUTOSAVE_MAX_DELAY_MS:
+        autosave()
+    else:
+        autosave_job = root.after(AUTOSAVE_DELAY_MS, autosave)
+
+def autosave(force_snapshot=False):
+    global first_pending_at, autosave_job, journal_ops, needs_snapshot
+    autosave_job = None
+    first_pending_at = None
+    ops = pending_ops[:]
+    pending_ops.clear()
+    journal_ops += len(ops)
+    snapshot = None
+    if snapshots_blocked:
         pass
+    elif force_snapshot or needs_snapshot or journal_ops >= COMPACT_EVERY:
+        snapshot = task_listbox.get(0, tk.END)
+        journal_ops = 0
+        needs_snapshot = False
+    if ops or snapshot is not None:
+        save_queue.put((ops, snapshot))
+        root.after(AUTOSAVE_DELAY_MS, report_save_errors)
+
+def report_save_errors():
+    global needs_snapshot
+    errors = []
+    while True:
+        try:
+            errors.append(save_errors.get_nowait())
+        except queue.Empty:
+            break
+    if errors:
+        needs_snapshot = True
+        status_var.set(f"⚠️ Could not save tasks: {errors[-1]}")
+    return errors
+
+def back_up_unreadable():
+    suffix = time.strftime(".unreadable-%Y%m%d-%H%M%S")
+    moved = []
+    for path in (TASKS_FILE, JOURNAL_FILE, COMPACTING_FILE, SNAPSHOT_TMP):
+        if os.path.exists(path):
+            os.replace(path, path + suffix)
+            moved.append(path + suffix)
+    return moved
+
+def load_tasks():
+    global journal_ops, snapshots_blocked
+    try:
+        tasks, journal_ops = read_tasks()
+    except (OSError, ValueError) as e:
+        tasks, journal_ops = [], 0
+        # Never let a later snapshot overwrite data we failed to read.
+        try:
+            moved = back_up_unreadable()
+        except OSError as backup_error:
+            snapshots_blocked = True
+            messagebox.showerror("Load failed", f"Could not read saved tasks:\n{e}\n\n"
+                                 f"They could not be backed up either ({backup_error}), so {TASKS_FILE} "
+                                 "will be left untouched and new tasks are only appended to the journal.")
+        else:
+            messagebox.showerror("Load failed", f"Could not read saved tasks:\n{e}\n\n"
+                                 "The unreadable files were kept as:\n" + "\n".join(moved))
+    if tasks:
+        task_listbox.insert(tk.END, *tasks)
+    open_journal()
+    threading.Thread(target=save_worker, name="autosave", daemon=True).start()
+    if os.path.exists(COMPACTING_FILE) or os.path.exists(SNAPSHOT_TMP):
+        autosave(force_snapshot=True)
+
+def save_tasks():
+    if autosave_job is not None:
+        root.after_cancel(autosave_job)
+    autosave(force_snapshot=bool(journal_ops or pending_ops))
+    save_queue.join()
+    return not report_save_errors()
 
 def on_close():
-    save_tasks()
+    if not save_tasks():
+        if not messagebox.askyesno("Save failed", "Some changes could not be saved. Quit anyway?"):
+            return
+    save_queue.put(None)
+    save_queue.join()
     root.destroy()
 
-root = tk.Tk()
-root.title("To-Do List")
-root.geometry("380x420")
-root.resizable(False, False)
-root.configure(bg="#f5f7fb")
-
-style = ttk.Style(root)
-try:
-    style.theme_use("clam")
-except:
-    pass
-
-frame = ttk.Frame(root, padding=16)
-frame.pack(fill="both", expand=True)
-
-title = ttk.Label(frame, text="📝 My To-Do List", font=("Segoe UI", 16, "bold"))
-title.grid(row=0, column=0, columnspan=3, pady=(0, 10), sticky="w")
-
-task_var = tk.StringVar()
-task_entry = ttk.Entry(frame, textvariable=task_var, width=30, font=("Segoe UI", 10))
-task_entry.grid(row=1, column=0, columnspan=2, sticky="we", padx=(0,8))
-task_entry.focus()
-
-add_btn = ttk.Button(frame, text="Add", command=add_task, width=10)
-add_btn.grid(row=1, column=2, sticky="e")
-
-list_frame = ttk.Frame(frame)
-list_frame.grid(row=2, column=0, columnspan=3, pady=12, sticky="nsew")
-frame.rowconfigure(2, weight=1)
-frame.columnconfigure(0, weight=1)
-
-scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
-task_listbox = tk.Listbox(
-    list_frame,
-    height=12,
-    activestyle="none",
-    selectmode=tk.EXTENDED,
-    yscrollcommand=scrollbar.set,
-    font=("Segoe UI", 10),
-    bd=0,
-    relief="solid",
-    highlightthickness=1,
-    highlightbackground="#d9e0ea",
-    selectbackground="#cfe3ff",
-)
-scrollbar.config(command=task_listbox.yview)
-task_listbox.pack(side="left", fill="both", expand=True)
-scrollbar.pack(side="right", fill="y")
-
-delete_btn = ttk.Button(frame, text="Delete Selected", command=delete_task)
-delete_btn.grid(row=3, column=0, pady=(6,0), sticky="w")
-
-clear_btn = ttk.Button(frame, text="Clear All", command=clear_all)
-clear_btn.grid(row=3, column=1, pady=(6,0))
-
-quit_btn = ttk.Button(frame, text="Quit", command=on_close)
-quit_btn.grid(row=3, column=2, pady=(6,0), sticky="e")
-
-status_var = tk.StringVar(value="Welcome — add a task and press Enter")
-status_label = ttk.Label(root, textvariable=status_var, relief="flat", anchor="w", background="#f5f7fb")
-status_label.pack(fill="x", side="bottom", ipady=6, padx=8, pady=(0,8))
-
-task_entry.bind("<Return>", add_task)
-task_listbox.bind("<Double-Button-1>", on_double_click)
-task_listbox.bind("<Delete>", lambda e: delete_task())
-
-load_tasks()
-root.protocol("WM_DELETE_WINDOW", on_close)
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("To-Do List")
+    root.geometry("380x420")
+    root.resizable(False, False)
+    root.configure(bg="#f5f7fb")
+
+    style = ttk.Style(root)
+    try:
+        style.theme_use("clam")
+    except:
+        pass
+
+    frame = ttk.Frame(root, padding=16)
+    frame.pack(fill="both", expand=True)
+
+    title = ttk.Label(frame, text="📝 My To-Do List", font=("Segoe UI", 16, "bold"))
+    title.grid(row=0, column=0, columnspan=3, pady=(0, 10), sticky="w")
+
+    task_var = tk.StringVar()
+    task_entry = ttk.Entry(frame, textvariable=task_var, width=30, font=("Segoe UI", 10))
+    task_entry.grid(row=1, column=0, columnspan=2, sticky="we", padx=(0,8))
+    task_entry.focus()
+
+    add_btn = ttk.Button(frame, text="Add", command=add_task, width=10)
+    add_btn.grid(row=1, column=2, sticky="e")
+
+    list_frame = ttk.Frame(frame)
+    list_frame.grid(row=2, column=0, columnspan=3, pady=12, sticky="nsew")
+    frame.rowconfigure(2, weight=1)
+    frame.columnconfigure(0, weight=1)
+
+    scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
+    task_listbox = tk.Listbox(
+        list_frame,
+        height=12,
+        activestyle="none",
+        selectmode=tk.EXTENDED,
+        yscrollcommand=scrollbar.set,
+        font=("Segoe UI", 10),
+        bd=0,
+        relief="solid",
+        highlightthickness=1,
+        highlightbackground="#d9e0ea",
+        selectbackground="#cfe3ff",
+    )
+    scrollbar.config(command=task_listbox.yview)
+    task_listbox.pack(side="left", fill="both", expand=True)
+    scrollbar.pack(side="right", fill="y")
+
+    delete_btn = ttk.Button(frame, text="Delete Selected", command=delete_task)
+    delete_btn.grid(row=3, column=0, pady=(6,0), sticky="w")
+
+    clear_btn = ttk.Button(frame, text="Clear All", command=clear_all)
+    clear_btn.grid(row=3, column=1, pady=(6,0))
+
+    quit_btn = ttk.Button(frame, text="Quit", command=on_close)
+    quit_btn.grid(row=3, column=2, pady=(6,0), sticky="e")
+
+    status_var = tk.StringVar(value="Welcome — add a task and press Enter")
+    status_label = ttk.Label(root, textvariable=status_var, relief="flat", anchor="w", background="#f5f7fb")
+    status_label.pack(fill="x", side="bottom", ipady=6, padx=8, pady=(0,8))
+
+    task_entry.bind("<Return>", add_task)
+    task_listbox.bind("<Double-Button-1>", on_double_click)
+    task_listbox.bind("<Delete>", lambda e: delete_task())
+
+    load_tasks()
+    root.protocol("WM_DELETE_WINDOW", on_close)
+    root.mainloop()
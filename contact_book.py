@@ -1,15 +1,53 @@
-from tkinter import Tk, Label, Listbox, Entry, Button, Scrollbar, END, messagebox
+import csv
+import sqlite3
+from itertools import islice
+from tkinter import Tk, Frame, Label, Listbox, Entry, Button, Scrollbar, StringVar, END, messagebox, filedialog, ttk
+from contact_store import (ContactStore, ContactReader, IMPORT_BATCH, export_contacts, format_contact,
+                           validate_contact)
+
+REVIEW_GROUPS = 10
+CONTACT_FILETYPES = [("Contact files", "*.csv *.vcf *.vcard"), ("CSV", "*.csv"), ("vCard", "*.vcf"), ("All files", "*.*")]
+
+store = ContactStore()
+row_ids = []
+search_job = None
+import_state = None
+
+def refresh_list():
+    global search_job
+    search_job = None
+    rows = store.search(search_var.get())
+    listbox.delete(0, END)
+    row_ids[:] = [row[0] for row in rows]
+    if rows:
+        listbox.insert(END, *map(format_contact, rows))
+    status_var.set(f"Showing {len(rows)} of {store.count()} contacts")
+
+def schedule_search(*args):
+    global search_job
+    if search_job is None:
+        search_job = root.after_idle(refresh_list)
 
 def add_contact():
     name = name_entry.get().strip()
     phone = phone_entry.get().strip()
     email = email_entry.get().strip()
 
-    if name == "" or phone == "" or email == "":
-        messagebox.showwarning("Input Error", "Please fill all fields.")
+    error = validate_contact(name, phone, email)
+    if error:
+        messagebox.showwarning("Input Error", error)
     else:
-        contact = f"{name} | {phone} | {email}"
-        listbox.insert(END, contact)
+        duplicate = store.find_duplicate(phone, email)
+        if duplicate is not None:
+            existing = format_contact(store.get(duplicate))
+            if not messagebox.askyesno("Duplicate Contact",
+                                       f"This phone or email already belongs to:\n{existing}\n\n"
+                                       "Merge the new details into that contact?"):
+                return
+            store.update(duplicate, name, phone, email)
+        else:
+            store.add(name, phone, email)
+        refresh_list()
         name_entry.delete(0, END)
         phone_entry.delete(0, END)
         email_entry.delete(0, END)
@@ -17,13 +55,121 @@ def add_contact():
 def remove_contact():
     try:
         selected_contact = listbox.curselection()[0]
-        listbox.delete(selected_contact)
     except IndexError:
         messagebox.showwarning("Selection Error", "No contact selected.")
+        return
+    store.delete(row_ids.pop(selected_contact))
+    listbox.delete(selected_contact)
+    status_var.set(f"Showing {len(row_ids)} of {store.count()} contacts")
+
+def merge_duplicates():
+    groups, similar = store.find_duplicate_groups()
+    if not groups and not similar:
+        messagebox.showinfo("Merge Duplicates", "No duplicate contacts found.")
+        return
+    if groups:
+        extra = [contact_id for group in groups for contact_id in group[1:]]
+        if messagebox.askyesno("Merge Duplicates",
+                               f"Found {len(groups)} groups of contacts sharing a phone number or email.\n"
+                               f"Keep the oldest contact in each group and remove {len(extra)} others?"):
+            store.delete_many(extra)
+            refresh_list()
+    if similar:
+        # Similar names alone are not proof of a duplicate, so these are only listed.
+        lines = ["\n".join(format_contact(store.get(contact_id)) for contact_id in group)
+                 for group in similar[:REVIEW_GROUPS]]
+        more = f"\n\n...and {len(similar) - REVIEW_GROUPS} more." if len(similar) > REVIEW_GROUPS else ""
+        messagebox.showinfo("Review Similar Names",
+                            f"{len(similar)} groups have similar names but no shared phone or email. "
+                            "They were not removed; please review them:\n\n" + "\n\n".join(lines) + more)
+
+def set_busy(busy):
+    state = "disabled" if busy else "normal"
+    for widget in (add_button, remove_button, merge_button, import_button, export_button, search_entry):
+        widget.config(state=state)
+
+def import_contacts():
+    global import_state, search_job
+    path = filedialog.askopenfilename(title="Import Contacts", filetypes=CONTACT_FILETYPES)
+    if not path:
+        return
+    try:
+        reader = ContactReader(path)
+    except OSError as e:
+        messagebox.showerror("Import Error", f"Could not open file:\n{e}")
+        return
+    import_state = {"reader": reader, "added": 0, "invalid": 0, "duplicates": 0, "job": None}
+    search_var.set("")
+    if search_job is not None:
+        root.after_cancel(search_job)
+        search_job = None
+    listbox.delete(0, END)
+    row_ids.clear()
+    set_busy(True)
+    progress["value"] = 0
+    progress.pack(before=listbox, pady=(0, 5))
+    import_step()
+
+def import_step():
+    state = import_state
+    state["job"] = None
+    try:
+        chunk = list(islice(state["reader"].records, IMPORT_BATCH))
+        rows, invalid, duplicates = store.import_batch(chunk)
+    except (csv.Error, OSError, sqlite3.Error) as e:
+        finish_import(f"Import stopped: {e}")
+        return
+    state["added"] += len(rows)
+    state["invalid"] += invalid
+    state["duplicates"] += duplicates
+    if rows:
+        row_ids.extend(row[0] for row in rows)
+        listbox.insert(END, *map(format_contact, rows))
+    progress["value"] = state["reader"].progress() * 100
+    status_var.set(f"Importing... {state['added']:,} added, "
+                   f"{state['duplicates']:,} duplicates, {state['invalid']:,} invalid")
+    if chunk:
+        state["job"] = root.after(1, import_step)
+    else:
+        finish_import()
+
+def finish_import(error=None):
+    global import_state
+    state = import_state
+    import_state = None
+    state["reader"].close()
+    progress.pack_forget()
+    set_busy(False)
+    summary = (f"Imported {state['added']:,} contacts. Skipped {state['duplicates']:,} duplicates "
+               f"and {state['invalid']:,} incomplete records.")
+    status_var.set(f"Showing {len(row_ids)} of {store.count()} contacts")
+    if error:
+        messagebox.showerror("Import Error", f"{error}\n\n{summary}")
+    else:
+        messagebox.showinfo("Import Complete", summary)
+
+def export_all():
+    path = filedialog.asksaveasfilename(title="Export Contacts", defaultextension=".csv", filetypes=CONTACT_FILETYPES)
+    if not path:
+        return
+    try:
+        count = export_contacts(store, path)
+    except (OSError, sqlite3.Error) as e:
+        messagebox.showerror("Export Error", f"Could not export contacts:\n{e}")
+        return
+    status_var.set(f"Exported {count:,} contacts")
+
+def on_close():
+    if import_state is not None:
+        if import_state["job"] is not None:
+            root.after_cancel(import_state["job"])
+        import_state["reader"].close()
+    store.close()
+    root.destroy()
 
 root = Tk()
 root.title("📒 Contact Book")
-root.geometry("400x400")
+root.geometry("400x640")
 root.config(bg="#f5f7fa")
 
 Label(root, text="Name:", font=("Poppins", 11), bg="#f5f7fa").pack(pady=(10,0))
@@ -44,7 +190,31 @@ add_button.pack(pady=(10, 5))
 
 remove_button = Button(root, text="Remove Contact", bg="#dc3545", fg="white", font=("Poppins", 10, "bold"),
                        relief="flat", padx=10, pady=5, command=remove_contact)
-remove_button.pack(pady=(0, 10))
+remove_button.pack(pady=(0, 5))
+
+merge_button = Button(root, text="Merge Duplicates", bg="#6c757d", fg="white", font=("Poppins", 10, "bold"),
+                      relief="flat", padx=10, pady=5, command=merge_duplicates)
+merge_button.pack(pady=(0, 5))
+
+file_frame = Frame(root, bg="#f5f7fa")
+file_frame.pack(pady=(0, 10))
+import_button = Button(file_frame, text="Import...", bg="#17a2b8", fg="white", font=("Poppins", 10, "bold"),
+                       relief="flat", padx=10, pady=5, command=import_contacts)
+import_button.pack(side="left", padx=5)
+export_button = Button(file_frame, text="Export...", bg="#17a2b8", fg="white", font=("Poppins", 10, "bold"),
+                       relief="flat", padx=10, pady=5, command=export_all)
+export_button.pack(side="left", padx=5)
+
+Label(root, text="Search:", font=("Poppins", 11), bg="#f5f7fa").pack(pady=(5,0))
+search_var = StringVar()
+search_entry = Entry(root, width=40, font=("Poppins", 10), textvariable=search_var)
+search_entry.pack(pady=5)
+search_var.trace_add("write", schedule_search)
+
+status_var = StringVar()
+Label(root, textvariable=status_var, font=("Poppins", 9), bg="#f5f7fa", fg="#555").pack()
+
+progress = ttk.Progressbar(root, length=300, mode="determinate", maximum=100)
 
 frame = Scrollbar(root)
 listbox = Listbox(root, width=50, height=10, font=("Poppins", 10))
@@ -53,4 +223,6 @@ scrollbar = Scrollbar(root, orient="vertical", command=listbox.yview)
 scrollbar.pack(side="right", fill="y")
 listbox.config(yscrollcommand=scrollbar.set)
 
+refresh_list()
+root.protocol("WM_DELETE_WINDOW", on_close)
 root.mainloop()
\ No newline at end of file
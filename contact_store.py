@@ -0,0 +1,420 @@
+import os
+import re
+import csv
+import sqlite3
+from itertools import chain
+from contextlib import contextmanager
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "contacts.db")
+SEARCH_LIMIT = 500
+IMPORT_BATCH = 2000
+CSV_FIELDS = ("name", "phone", "email")
+VCARD_EXTENSIONS = (".vcf", ".vcard")
+VCARD_ESCAPE_RE = re.compile(r"\\(.)")
+PHONE_KEY_DIGITS = 10
+MIN_PHONE_DIGITS = 7
+GMAIL_DOMAINS = {"gmail.com", "googlemail.com"}
+NAME_SIMILARITY = 0.88
+NAME_WINDOW = 50
+NON_DIGIT_RE = re.compile(r"\D+")
+NON_ALPHA_RE = re.compile(r"[^a-z]+")
+REPEAT_RE = re.compile(r"(\d)\1+")
+SOUNDEX_TABLE = {ord(ch): str(code) for code, letters in enumerate(
+    ("aeiouyhw", "bfpv", "cgjkqsxz", "dt", "l", "mn", "r")) for ch in letters}
+DROP_HW = {ord("h"): None, ord("w"): None}
+PROFILE = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "cache_size": -8000,
+    "temp_store": "memory",
+}
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS contacts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        phone TEXT NOT NULL,
+        email TEXT NOT NULL,
+        name_key TEXT NOT NULL,
+        phone_key TEXT NOT NULL,
+        email_key TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_contacts_name_key ON contacts(name_key, id);
+    CREATE INDEX IF NOT EXISTS idx_contacts_phone_key ON contacts(phone_key);
+    CREATE INDEX IF NOT EXISTS idx_contacts_email_key ON contacts(email_key);
+    """,
+    # Canonical keys live in indexed columns so duplicate checks are index lookups and
+    # nothing has to be loaded into memory at startup.
+    """
+    ALTER TABLE contacts ADD COLUMN phone_canon TEXT;
+    ALTER TABLE contacts ADD COLUMN email_canon TEXT;
+    UPDATE contacts SET phone_canon = canonical_phone(phone), email_canon = canonical_email(email);
+    CREATE INDEX IF NOT EXISTS idx_contacts_phone_canon ON contacts(phone_canon) WHERE phone_canon IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS idx_contacts_email_canon ON contacts(email_canon) WHERE email_canon IS NOT NULL;
+    """,
+]
+SEARCH_SQL = """
+SELECT id, name, phone, email FROM contacts
+WHERE {column} >= ? AND {column} < ?
+ORDER BY {column}
+LIMIT ?
+"""
+LIST_SQL = "SELECT id, name, phone, email FROM contacts ORDER BY name_key, id LIMIT ?"
+DUPLICATE_SQL = "SELECT id FROM contacts WHERE {column} = ? AND id IS NOT ? ORDER BY id LIMIT 1"
+
+def name_key(name):
+    return " ".join(name.split()).casefold()
+
+def phone_key(phone):
+    return NON_DIGIT_RE.sub("", phone)
+
+def email_key(email):
+    return email.strip().casefold()
+
+def canonical_phone(phone):
+    digits = phone_key(phone)
+    if digits.startswith("00"):
+        digits = digits[2:]
+    if len(digits) < MIN_PHONE_DIGITS:
+        return None
+    # Country codes and trunk prefixes vary; the trailing national digits do not.
+    return digits[-PHONE_KEY_DIGITS:]
+
+def canonical_email(email):
+    local, at, domain = email_key(email).rpartition("@")
+    if not at or not local or "." not in domain:
+        return None
+    local = local.split("+", 1)[0]
+    if domain in GMAIL_DOMAINS:
+        local = local.replace(".", "")
+        domain = "gmail.com"
+    return f"{local}@{domain}"
+
+@lru_cache(maxsize=65536)
+def soundex(word):
+    letters = NON_ALPHA_RE.sub("", word.casefold())
+    if not letters:
+        return ""
+    # h and w are dropped so equal codes on either side of them still collapse.
+    codes = REPEAT_RE.sub(r"\1", (letters[0] + letters[1:].translate(DROP_HW)).translate(SOUNDEX_TABLE))
+    return (letters[0].upper() + codes[1:].replace("0", "") + "000")[:4]
+
+def name_block_key(name):
+    return " ".join(sorted(soundex(token) for token in name_key(name).split()))
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+def duplicate_clusters(contacts):
+    # Only records sharing a blocking key are ever compared, so this stays
+    # near-linear instead of comparing every pair of records.
+    # Returns (exact, similar): clusters linked by a shared phone or email, and
+    # clusters of those survivors whose names are merely alike.
+    contacts = list(contacts)
+    uf = _UnionFind(len(contacts))
+    exact, by_name = {}, {}
+    for i, (name, phone, email) in enumerate(contacts):
+        for key in (("p", canonical_phone(phone)), ("e", canonical_email(email))):
+            if key[1] is None:
+                continue
+            if key in exact:
+                uf.union(exact[key], i)
+            else:
+                exact[key] = i
+        block = name_block_key(name)
+        if block:
+            by_name.setdefault(block, []).append(i)
+    exact_root = [uf.find(i) for i in range(len(contacts))]
+    for members in by_name.values():
+        if len(members) < 2:
+            continue
+        same_name = {}
+        for i in members:
+            same_name.setdefault(" ".join(sorted(name_key(contacts[i][0]).split())), []).append(i)
+        for ids in same_name.values():
+            for j in ids[1:]:
+                uf.union(ids[0], j)
+        # Each distinct name is compared with the next NAME_WINDOW names in sorted order: small
+        # blocks are compared in full, and a large block of common names stays linear because
+        # near-identical spellings sort next to each other.
+        keyed = sorted((key, ids[0]) for key, ids in same_name.items())
+        for a, (key, i) in enumerate(keyed):
+            matcher = SequenceMatcher(None, b=key)
+            for other, j in keyed[a + 1:a + 1 + NAME_WINDOW]:
+                if uf.find(i) == uf.find(j):
+                    continue
+                matcher.set_seq1(other)
+                if matcher.quick_ratio() >= NAME_SIMILARITY and matcher.ratio() >= NAME_SIMILARITY:
+                    uf.union(i, j)
+    exact, similar = {}, {}
+    for i, root in enumerate(exact_root):
+        exact.setdefault(root, []).append(i)
+        if root == i:
+            similar.setdefault(uf.find(i), []).append(i)
+    return ([members for members in exact.values() if len(members) > 1],
+            [members for members in similar.values() if len(members) > 1])
+
+def prefix_range(prefix):
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def format_contact(row):
+    return f"{row[1]} | {row[2]} | {row[3]}"
+
+def validate_contact(name, phone, email):
+    if name == "" or phone == "" or email == "":
+        return "Please fill all fields."
+    return None
+
+def iter_csv(f):
+    reader = csv.reader(f)
+    first = next(reader, None)
+    if first is None:
+        return
+    header = [cell.strip().casefold() for cell in first]
+    if all(field in header for field in CSV_FIELDS):
+        columns = [header.index(field) for field in CSV_FIELDS]
+    else:
+        columns = [0, 1, 2]
+        reader = chain([first], reader)
+    for row in reader:
+        if any(row):
+            yield tuple(row[i].strip() if i < len(row) else "" for i in columns)
+
+def _vcard_unescape(value):
+    return VCARD_ESCAPE_RE.sub(lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+def _vcard_escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace(",", "\\,").replace(";", "\\;")
+
+def _unfold(f):
+    pending = None
+    for line in f:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending is not None:
+        yield pending
+
+def iter_vcard(f):
+    card = None
+    for line in _unfold(f):
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        prop = key.split(";", 1)[0].rsplit(".", 1)[-1].upper()
+        if prop == "BEGIN" and value.strip().upper() == "VCARD":
+            card = {}
+        elif card is None:
+            continue
+        elif prop == "END":
+            name = card.get("FN") or card.get("N", "")
+            yield name, card.get("TEL", ""), card.get("EMAIL", "")
+            card = None
+        elif prop == "N" and "N" not in card:
+            parts = [_vcard_unescape(part).strip() for part in value.split(";")]
+            card["N"] = " ".join(part for part in parts[1:3] + parts[:1] if part)
+        elif prop in ("FN", "TEL", "EMAIL") and prop not in card:
+            card[prop] = _vcard_unescape(value).strip()
+
+def format_vcard(row):
+    name, phone, email = (_vcard_escape(value) for value in row[1:4])
+    return f"BEGIN:VCARD\r\nVERSION:3.0\r\nFN:{name}\r\nN:;{name};;;\r\nTEL:{phone}\r\nEMAIL:{email}\r\nEND:VCARD\r\n"
+
+class ContactReader:
+    def __init__(self, path):
+        self.size = os.path.getsize(path)
+        self.file = open(path, newline="", encoding="utf-8-sig", errors="replace")
+        parse = iter_vcard if path.lower().endswith(VCARD_EXTENSIONS) else iter_csv
+        self.records = parse(self.file)
+
+    def progress(self):
+        return min(self.file.buffer.tell() / self.size, 1.0) if self.size else 1.0
+
+    def close(self):
+        self.file.close()
+
+def export_contacts(store, path):
+    tmp = path + ".tmp"
+    count = 0
+    try:
+        with open(tmp, "w", newline="", encoding="utf-8") as f:
+            if path.lower().endswith(VCARD_EXTENSIONS):
+                for rows in store.iter_batches():
+                    f.writelines(map(format_vcard, rows))
+                    count += len(rows)
+            else:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
+                for rows in store.iter_batches():
+                    writer.writerows(row[1:] for row in rows)
+                    count += len(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    return count
+
+class ContactStore:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(self.path)
+        self.conn.create_function("canonical_phone", 1, canonical_phone, deterministic=True)
+        self.conn.create_function("canonical_email", 1, canonical_email, deterministic=True)
+        self._batch_depth = 0
+        for name, value in PROFILE.items():
+            self.conn.execute(f"PRAGMA {name} = {value}")
+        self._migrate()
+
+    def find_duplicate(self, phone, email, exclude=None):
+        for column, key in (("phone_canon", canonical_phone(phone)), ("email_canon", canonical_email(email))):
+            if key is None:
+                continue
+            row = self.conn.execute(DUPLICATE_SQL.format(column=column), (key, exclude)).fetchone()
+            if row is not None:
+                return row[0]
+        return None
+
+    def _migrate(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, script in enumerate(MIGRATIONS[version:], start=version + 1):
+            try:
+                self.conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {number};\nCOMMIT;")
+            except sqlite3.Error:
+                if self.conn.in_transaction:
+                    self.conn.rollback()
+                raise
+
+    def _commit(self):
+        if not self._batch_depth:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        self._batch_depth += 1
+        try:
+            yield self
+            if self._batch_depth == 1:
+                self.conn.commit()
+        except BaseException:
+            if self._batch_depth == 1:
+                self.conn.rollback()
+            raise
+        finally:
+            self._batch_depth -= 1
+
+    def add(self, name, phone, email):
+        cur = self.conn.execute(
+            "INSERT INTO contacts (name, phone, email, name_key, phone_key, email_key, phone_canon, email_canon) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (name, phone, email, name_key(name), phone_key(phone), email_key(email),
+             canonical_phone(phone), canonical_email(email)),
+        )
+        self._commit()
+        return cur.lastrowid
+
+    def update(self, contact_id, name, phone, email):
+        self.conn.execute(
+            "UPDATE contacts SET name = ?, phone = ?, email = ?, name_key = ?, phone_key = ?, email_key = ?, "
+            "phone_canon = ?, email_canon = ? WHERE id = ?",
+            (name, phone, email, name_key(name), phone_key(phone), email_key(email),
+             canonical_phone(phone), canonical_email(email), contact_id),
+        )
+        self._commit()
+
+    def add_many(self, contacts):
+        added = 0
+        with self.batch():
+            for name, phone, email in contacts:
+                if self.find_duplicate(phone, email) is None:
+                    self.add(name, phone, email)
+                    added += 1
+        return added
+
+    def delete(self, contact_id):
+        self.conn.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+        self._commit()
+
+    def delete_many(self, contact_ids):
+        with self.batch():
+            self.conn.executemany("DELETE FROM contacts WHERE id = ?", ((i,) for i in contact_ids))
+
+    def import_batch(self, records):
+        rows, invalid, duplicates = [], 0, 0
+        with self.batch():
+            for name, phone, email in records:
+                if validate_contact(name, phone, email):
+                    invalid += 1
+                elif self.find_duplicate(phone, email) is not None:
+                    duplicates += 1
+                else:
+                    rows.append((self.add(name, phone, email), name, phone, email))
+        return rows, invalid, duplicates
+
+    def iter_batches(self, size=IMPORT_BATCH):
+        cur = self.conn.execute("SELECT id, name, phone, email FROM contacts ORDER BY name_key, id")
+        while True:
+            rows = cur.fetchmany(size)
+            if not rows:
+                break
+            yield rows
+
+    def find_duplicate_groups(self):
+        rows = self.conn.execute("SELECT id, name, phone, email FROM contacts ORDER BY id").fetchall()
+        exact, similar = duplicate_clusters(row[1:] for row in rows)
+        return ([[rows[i][0] for i in members] for members in exact],
+                [[rows[i][0] for i in members] for members in similar])
+
+    def get(self, contact_id):
+        return self.conn.execute(
+            "SELECT id, name, phone, email FROM contacts WHERE id = ?", (contact_id,)
+        ).fetchone()
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+    def search(self, text, limit=SEARCH_LIMIT):
+        key = name_key(text)
+        if not key:
+            return self.conn.execute(LIST_SQL, (limit,)).fetchall()
+        prefixes = [("name_key", key), ("email_key", email_key(text)), ("phone_key", phone_key(text))]
+        rows, seen = [], set()
+        for column, prefix in prefixes:
+            if not prefix or len(rows) >= limit:
+                continue
+            sql = SEARCH_SQL.format(column=column)
+            for row in self.conn.execute(sql, (*prefix_range(prefix), limit - len(rows))):
+                if row[0] not in seen:
+                    seen.add(row[0])
+                    rows.append(row)
+        return rows
+
+    def close(self):
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        self.conn.close()
@@ -1,6 +1,77 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
+import tkinter.font as tkfont
 import os
+import re
+import io
+import json
+import mmap
+import codecs
+import queue
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+LARGE_FILE_BYTES = 4 * 1024 * 1024
+PAGED_VIEW_BYTES = 64 * 1024 * 1024
+LOAD_CHUNK_BYTES = 256 * 1024
+INDEX_POLL_MS = 200
+SAVE_CHUNK_LINES = 5000
+SAVE_QUEUE_CHUNKS = 8
+SAVE_POLL_MS = 30
+SWAP_FLUSH_MS = 2000
+FIND_DELAY_MS = 200
+FIND_BATCH_LINES = 20000
+MATCH_TAG = "find_match"
+CURRENT_MATCH_TAG = "find_current"
+
+class LineIndex:
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.offsets = array("Q", [0])
+        self.done = not self.size
+        self._stop = False
+        self._thread = threading.Thread(target=self._build, daemon=True)
+        self._thread.start()
+
+    def _build(self):
+        find = self.mm.find
+        append = self.offsets.append
+        pos = 0
+        while not self._stop and pos < self.size:
+            nl = find(b"\n", pos)
+            if nl == -1:
+                break
+            pos = nl + 1
+            append(pos)
+        self.done = True
+
+    def line_count(self):
+        n = len(self.offsets)
+        if self.done and self.offsets[-1] >= self.size and n > 1:
+            n -= 1
+        return n
+
+    def read_lines(self, start, count):
+        n = len(self.offsets)
+        begin = self.offsets[start] if start < n else self.size
+        end_line = start + count
+        if end_line < n:
+            end = self.offsets[end_line]
+        else:
+            end = self.size if self.done else self.offsets[n - 1]
+        return self.mm[begin:max(begin, end)].decode("utf-8", errors="replace")
+
+    def close(self):
+        self._stop = True
+        self._thread.join()
+        if self.size:
+            self.mm.close()
+        self._file.close()
 
 class SaveBeforeCloseDialog(tk.Toplevel):
     def __init__(self, parent, filename=None):
@@ -37,6 +108,254 @@ class SaveBeforeCloseDialog(tk.Toplevel):
         self.result = "cancel"
         self.destroy()
 
+class FindReplaceDialog(tk.Toplevel):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent
+        self.text = parent.text
+        self.title("Find / Replace")
+        self.resizable(False, False)
+        self.transient(parent)
+        self.matches = []
+        self.current = -1
+        self._regex = None
+        self._scan_line = None
+        self._last_line = 0
+        self._scan_job = None
+        self._search_job = None
+        self._highlight_job = None
+        self._suppress = False
+        self.find_var = tk.StringVar()
+        self.replace_var = tk.StringVar()
+        self.regex_var = tk.BooleanVar(value=False)
+        self.case_var = tk.BooleanVar(value=False)
+        self.info_var = tk.StringVar(value="")
+        body = ttk.Frame(self, padding=12)
+        body.pack(fill="both", expand=True)
+        ttk.Label(body, text="Find:").grid(row=0, column=0, sticky="w", pady=(0, 6))
+        self.find_entry = ttk.Entry(body, textvariable=self.find_var, width=32)
+        self.find_entry.grid(row=0, column=1, columnspan=2, sticky="we", pady=(0, 6))
+        ttk.Label(body, text="Replace:").grid(row=1, column=0, sticky="w", pady=(0, 6))
+        ttk.Entry(body, textvariable=self.replace_var, width=32).grid(row=1, column=1, columnspan=2, sticky="we", pady=(0, 6))
+        ttk.Checkbutton(body, text="Regex", variable=self.regex_var).grid(row=2, column=1, sticky="w")
+        ttk.Checkbutton(body, text="Match case", variable=self.case_var).grid(row=2, column=2, sticky="w")
+        ttk.Label(body, textvariable=self.info_var, foreground="#555").grid(row=3, column=0, columnspan=3, sticky="w", pady=(6, 0))
+        btn_frame = ttk.Frame(body)
+        btn_frame.grid(row=4, column=0, columnspan=3, pady=(10, 0))
+        ttk.Button(btn_frame, text="Previous", command=self.find_previous).pack(side="left", padx=2)
+        ttk.Button(btn_frame, text="Next", command=self.find_next).pack(side="left", padx=2)
+        ttk.Button(btn_frame, text="Replace", command=self.replace_one).pack(side="left", padx=2)
+        ttk.Button(btn_frame, text="Replace All", command=self.replace_all).pack(side="left", padx=2)
+        ttk.Button(btn_frame, text="Close", command=self._close).pack(side="left", padx=2)
+        self.text.tag_configure(MATCH_TAG, background="#fff3a0")
+        self.text.tag_configure(CURRENT_MATCH_TAG, background="#ffb347")
+        self.text.tag_raise(CURRENT_MATCH_TAG, MATCH_TAG)
+        for var in (self.find_var, self.regex_var, self.case_var):
+            var.trace_add("write", lambda *a: self.schedule_search())
+        self.bind("<Return>", lambda e: self.find_next())
+        self.bind("<Shift-Return>", lambda e: self.find_previous())
+        self.bind("<Escape>", lambda e: self._close())
+        self.update_idletasks()
+        x = self.parent.winfo_rootx() + (self.parent.winfo_width() // 2) - (self.winfo_width() // 2)
+        y = self.parent.winfo_rooty() + (self.parent.winfo_height() // 2) - (self.winfo_height() // 2)
+        self.geometry(f"+{x}+{y}")
+        self.protocol("WM_DELETE_WINDOW", self._close)
+        self.find_entry.focus_set()
+
+    def schedule_search(self):
+        if self._suppress:
+            return
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(FIND_DELAY_MS, self.start_search)
+
+    def start_search(self):
+        self._search_job = None
+        if self._scan_job is not None:
+            self.after_cancel(self._scan_job)
+            self._scan_job = None
+        self.matches = []
+        self.current = -1
+        self._scan_line = None
+        self.text.tag_remove(MATCH_TAG, "1.0", tk.END)
+        self.text.tag_remove(CURRENT_MATCH_TAG, "1.0", tk.END)
+        pattern = self.find_var.get()
+        if not pattern:
+            self.info_var.set("")
+            return
+        flags = 0 if self.case_var.get() else re.IGNORECASE
+        try:
+            self._regex = re.compile(pattern if self.regex_var.get() else re.escape(pattern), flags)
+        except re.error as e:
+            self.info_var.set(f"Invalid pattern: {e}")
+            return
+        self._scan_line = 1
+        self._last_line = int(self.text.index("end-1c").split(".")[0])
+        self._scan_job = self.after_idle(self._scan_batch)
+
+    def _scan_lines(self, start, stop):
+        chunk = self.text.get(f"{start}.0", f"{stop}.0")
+        finditer = self._regex.finditer
+        for offset, line in enumerate(chunk.split("\n")[:stop - start]):
+            for m in finditer(line):
+                if m.end() > m.start():
+                    self.matches.append((start + offset, m.start(), m.end()))
+
+    def _scan_batch(self):
+        self._scan_job = None
+        stop = min(self._scan_line + FIND_BATCH_LINES, self._last_line + 1)
+        self._scan_lines(self._scan_line, stop)
+        self._scan_line = stop if stop <= self._last_line else None
+        if self.current == -1 and self.matches:
+            line, col = map(int, self.text.index("insert").split("."))
+            i = bisect_left(self.matches, (line, col, 0))
+            if i < len(self.matches):
+                self._select(i)
+        self.highlight_visible()
+        self._update_info()
+        if self._scan_line is not None:
+            self._scan_job = self.after(1, self._scan_batch)
+
+    def _finish_scan(self):
+        if self._scan_job is not None:
+            self.after_cancel(self._scan_job)
+            self._scan_job = None
+        if self._scan_line is not None:
+            self._scan_lines(self._scan_line, self._last_line + 1)
+            self._scan_line = None
+
+    def _update_info(self):
+        more = "+ (searching...)" if self._scan_line is not None else ""
+        if not self.matches:
+            self.info_var.set("Searching..." if more else "No matches")
+        elif self.current >= 0:
+            self.info_var.set(f"{self.current + 1} of {len(self.matches)}{more}")
+        else:
+            self.info_var.set(f"{len(self.matches)}{more} matches")
+
+    def highlight_later(self):
+        if self._highlight_job is None:
+            self._highlight_job = self.after_idle(self.highlight_visible)
+
+    def highlight_visible(self):
+        self._highlight_job = None
+        first = int(self.text.index("@0,0").split(".")[0])
+        last = int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0])
+        self.text.tag_remove(MATCH_TAG, "1.0", tk.END)
+        lo = bisect_left(self.matches, (first, 0, 0))
+        hi = bisect_left(self.matches, (last + 1, 0, 0))
+        ranges = []
+        for line, start, end in self.matches[lo:hi]:
+            ranges.extend((f"{line}.{start}", f"{line}.{end}"))
+        if ranges:
+            self.text.tag_add(MATCH_TAG, *ranges)
+
+    def _select(self, i):
+        self.current = i
+        line, start, end = self.matches[i]
+        first, last = f"{line}.{start}", f"{line}.{end}"
+        self.text.tag_remove(CURRENT_MATCH_TAG, "1.0", tk.END)
+        self.text.tag_add(CURRENT_MATCH_TAG, first, last)
+        self.text.tag_remove("sel", "1.0", tk.END)
+        self.text.tag_add("sel", first, last)
+        self.text.mark_set("insert", last)
+        self.text.see(first)
+        self._update_info()
+
+    def find_next(self):
+        if not self.matches:
+            return
+        if self.current >= 0:
+            i = (self.current + 1) % len(self.matches)
+        else:
+            line, col = map(int, self.text.index("insert").split("."))
+            i = bisect_left(self.matches, (line, col, 0)) % len(self.matches)
+        self._select(i)
+
+    def find_previous(self):
+        if not self.matches:
+            return
+        if self.current >= 0:
+            i = (self.current - 1) % len(self.matches)
+        else:
+            line, col = map(int, self.text.index("insert").split("."))
+            i = (bisect_right(self.matches, (line, col, 0)) - 1) % len(self.matches)
+        self._select(i)
+
+    def _replacement(self, text, start, end):
+        m = self._regex.match(text, start)
+        if m is None or m.end() != end:
+            return None
+        repl = self.replace_var.get()
+        return m.expand(repl) if self.regex_var.get() else repl
+
+    def replace_one(self):
+        if self.current < 0 or self.text.cget("state") == "disabled":
+            return
+        line, start, end = self.matches[self.current]
+        first, last = f"{line}.{start}", f"{line}.{end}"
+        try:
+            new = self._replacement(self.text.get(f"{line}.0", f"{line}.end"), start, end)
+        except re.error as e:
+            self.info_var.set(f"Invalid replacement: {e}")
+            return
+        if new is None:
+            self.start_search()
+            return
+        self.text.edit_separator()
+        self.text.delete(first, last)
+        self.text.insert(first, new)
+        self.text.edit_separator()
+        self.text.mark_set("insert", f"{first} +{len(new)}c")
+        self.start_search()
+
+    def replace_all(self):
+        if self.text.cget("state") == "disabled":
+            return
+        if self._search_job is not None:
+            self.start_search()
+        if self._regex is None or not self.find_var.get():
+            return
+        self._finish_scan()
+        if not self.matches:
+            self._update_info()
+            return
+        count = 0
+        error = None
+        text_line, text = None, ""
+        self._suppress = True
+        self.text.configure(autoseparators=False)
+        self.text.edit_separator()
+        try:
+            for line, start, end in reversed(self.matches):
+                # Matches run backwards, so this reads each line before any of it is replaced.
+                if line != text_line:
+                    text_line, text = line, self.text.get(f"{line}.0", f"{line}.end")
+                new = self._replacement(text, start, end)
+                if new is None:
+                    continue
+                first, last = f"{line}.{start}", f"{line}.{end}"
+                self.text.delete(first, last)
+                self.text.insert(first, new)
+                count += 1
+        except re.error as e:
+            error = f"Invalid replacement: {e}"
+        finally:
+            self.text.edit_separator()
+            self.text.configure(autoseparators=True)
+            self._suppress = False
+        self.start_search()
+        self.info_var.set(error or f"Replaced {count} match(es)")
+
+    def _close(self):
+        for job in (self._scan_job, self._search_job, self._highlight_job):
+            if job is not None:
+                self.after_cancel(job)
+        self.text.tag_remove(MATCH_TAG, "1.0", tk.END)
+        self.text.tag_remove(CURRENT_MATCH_TAG, "1.0", tk.END)
+        self.parent._find_dialog = None
+        self.destroy()
+
 class TextEditorApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -44,6 +363,15 @@ class TextEditorApp(tk.Tk):
         self.geometry("800x500")
         self.current_filename = None
         self._text_modified = False
+        self._load = None
+        self._paged = None
+        self._paged_top = 0
+        self._save = None
+        self._swap = None
+        self._swap_ops = []
+        self._swap_job = None
+        self._recording = True
+        self._find_dialog = None
         self._create_widgets()
         self._create_menu()
         self._bind_events()
@@ -57,11 +385,14 @@ class TextEditorApp(tk.Tk):
         text_frame = ttk.Frame(self)
         text_frame.pack(fill="both", expand=True, padx=6, pady=6)
         self.text = tk.Text(text_frame, wrap="word", undo=True)
+        self._text_cmd = str(self.text) + "_orig"
+        self.tk.call("rename", str(self.text), self._text_cmd)
+        self.tk.createcommand(str(self.text), self._text_proxy)
         self.text.pack(side="left", fill="both", expand=True)
         self.text.focus_set()
-        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.text.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.text.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.text.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.text.configure(yscrollcommand=self._on_text_scroll)
         self.status_var = tk.StringVar(value="Ready")
         status = ttk.Label(self, textvariable=self.status_var, relief="sunken", anchor="w", padding=4)
         status.pack(side="bottom", fill="x")
@@ -75,6 +406,9 @@ class TextEditorApp(tk.Tk):
         filemenu.add_separator()
         filemenu.add_command(label="Exit", command=self.exit_app)
         menubar.add_cascade(label="File", menu=filemenu)
+        editmenu = tk.Menu(menubar, tearoff=0)
+        editmenu.add_command(label="Find/Replace...", accelerator="Ctrl+F", command=self.open_find)
+        menubar.add_cascade(label="Edit", menu=editmenu)
         self.config(menu=menubar)
 
     def _bind_events(self):
@@ -82,41 +416,293 @@ class TextEditorApp(tk.Tk):
         self.bind_all("<Control-n>", lambda e: self.new_file())
         self.bind_all("<Control-o>", lambda e: self.open_file())
         self.bind_all("<Control-s>", lambda e: self.save_file())
+        self.bind_all("<Control-f>", lambda e: self.open_find())
+        for sequence, lines in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "page-"), ("<Next>", "page+"),
+                                ("<Control-Home>", "home"), ("<Control-End>", "end"),
+                                ("<Button-4>", -3), ("<Button-5>", 3)):
+            self.text.bind(sequence, lambda e, n=lines: self._on_paged_scroll(n))
+        self.text.bind("<MouseWheel>", lambda e: self._on_paged_scroll(-3 if e.delta > 0 else 3))
+        self.text.bind("<Configure>", lambda e: self._paged and self._render_page())
         self.protocol("WM_DELETE_WINDOW", self.exit_app)
 
     def _on_text_modified(self, event=None):
+        if self._load is not None:
+            self.text.edit_modified(False)
+            return
         if self.text.edit_modified():
             self._text_modified = True
             self._update_status("Modified")
             self.text.edit_modified(False)
 
+    def _text_proxy(self, *args):
+        # A TclError escaping a createcommand callback ends mainloop() even when the Tcl caller
+        # wraps it in catch (Tk's copy/cut/paste bindings do), so report failure as an empty result.
+        try:
+            op = args[0] if args else ""
+            ops = []
+            if op in ("insert", "delete", "replace") and self._recording:
+                index = lambda i: self.tk.call(self._text_cmd, "index", i)
+                if op == "insert":
+                    ops.append(["i", index(args[1]), "".join(args[2::2])])
+                else:
+                    start = index(args[1])
+                    end = index(args[2]) if len(args) > 2 else index(f"{start} +1c")
+                    ops.append(["d", start, end])
+                    if op == "replace":
+                        ops.append(["i", start, "".join(args[3::2])])
+            result = self.tk.call((self._text_cmd,) + args)
+            for item in ops:
+                self._record(item)
+            if op in ("insert", "delete", "replace") and self._find_dialog is not None:
+                self._find_dialog.schedule_search()
+            return result
+        except tk.TclError:
+            return ""
+
+    def _on_text_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._find_dialog is not None:
+            self._find_dialog.highlight_later()
+
+    def open_find(self):
+        if self._paged is not None:
+            self._update_status("Find is not available in the read-only paged view")
+            return
+        if self._find_dialog is None:
+            self._find_dialog = FindReplaceDialog(self)
+        else:
+            self._find_dialog.lift()
+            self._find_dialog.find_entry.focus_set()
+
+    def _set_text(self, content):
+        self._recording = False
+        try:
+            self.text.delete("1.0", tk.END)
+            if content:
+                self.text.insert("1.0", content)
+        finally:
+            self._recording = True
+
+    def _swap_path(self, fname=None):
+        folder, base = os.path.split(fname or self.current_filename)
+        return os.path.join(folder, f".{base}.swp")
+
+    def _record(self, op):
+        if not self.current_filename or self._paged is not None or self._load is not None:
+            return
+        if str(self.tk.call(self._text_cmd, "cget", "-state")) == "disabled":
+            return
+        self._swap_ops.append(op)
+        if self._swap_job is None:
+            self._swap_job = self.after(SWAP_FLUSH_MS, self._flush_swap)
+
+    def _flush_swap(self):
+        self._swap_job = None
+        if not self._swap_ops or not self.current_filename:
+            self._swap_ops.clear()
+            return
+        try:
+            if self._swap is None:
+                self._swap = open(self._swap_path(), "w", encoding="utf-8")
+                mtime = os.stat(self.current_filename).st_mtime_ns if os.path.exists(self.current_filename) else None
+                self._swap.write(json.dumps({"file": self.current_filename, "mtime": mtime}) + "\n")
+            self._swap.write("".join(json.dumps(op, ensure_ascii=False) + "\n" for op in self._swap_ops))
+            self._swap.flush()
+            os.fsync(self._swap.fileno())
+        except OSError as e:
+            self._update_status(f"Autosave failed: {e}")
+        self._swap_ops.clear()
+
+    def _discard_swap(self):
+        if self._swap_job is not None:
+            self.after_cancel(self._swap_job)
+            self._swap_job = None
+        self._swap_ops.clear()
+        if self._swap is not None:
+            path = self._swap.name
+            self._swap.close()
+            self._swap = None
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _offer_recovery(self):
+        path = self._swap_path()
+        if not os.path.exists(path):
+            return
+        try:
+            if os.path.getmtime(path) <= os.path.getmtime(self.current_filename):
+                os.remove(path)
+                return
+            with open(path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+                ops = [json.loads(line) for line in f if line.endswith("\n")]
+        except (OSError, ValueError):
+            return
+        prompt = f"Unsaved changes to '{os.path.basename(self.current_filename)}' were found from a previous session."
+        if header.get("mtime") != os.stat(self.current_filename).st_mtime_ns:
+            prompt += "\n\nThe file has changed on disk since then, so the recovered text may not line up."
+        if not messagebox.askyesno("Recover changes?", prompt + "\n\nRecover them?", parent=self):
+            os.remove(path)
+            return
+        self._recording = False
+        try:
+            for op in ops:
+                if op[0] == "i":
+                    self.text.insert(op[1], op[2])
+                elif op[0] == "d":
+                    self.text.delete(op[1], op[2])
+        finally:
+            self._recording = True
+        self._swap = open(path, "a", encoding="utf-8")
+        self._text_modified = True
+        self._update_status(f"Recovered {len(ops)} change(s)")
+
     def _update_status(self, msg):
         filename_display = self.current_filename if self.current_filename else "Untitled"
         self.status_var.set(f"{filename_display} — {msg}")
 
-    def new_file(self):
-        if self._text_modified:
-            dlg = SaveBeforeCloseDialog(self, filename=self.current_filename)
-            self.wait_window(dlg)
-            if dlg.result == "save":
-                if not self.save_file():
-                    return
-            elif dlg.result == "cancel":
-                return
+    def _close_large_file(self):
+        if self._load is not None:
+            self._load["file"].close()
+            self._load = None
+            self.text.configure(state="normal", undo=True)
+        if self._paged is not None:
+            self._paged.close()
+            self._paged = None
+            self.text.configure(state="normal", wrap="word", undo=True, yscrollcommand=self._on_text_scroll)
+            self.scrollbar.configure(command=self.text.yview)
+
+    def _load_chunked(self, fname):
+        f = open(fname, "rb")
+        self._set_text("")
+        self.text.configure(undo=False, state="disabled")
+        self.current_filename = fname
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._load = {"file": f, "size": os.fstat(f.fileno()).st_size, "pos": 0,
+                      "decoder": io.IncrementalNewlineDecoder(decoder, translate=True)}
+        self.after_idle(self._load_next_chunk)
+
+    def _load_next_chunk(self):
+        job = self._load
+        if job is None:
+            return
+        data = job["file"].read(LOAD_CHUNK_BYTES)
+        end = job["pos"] + len(data)
+        chunk = job["decoder"].decode(data, final=not data)
+        self.text.configure(state="normal")
+        self.text.insert("end-1c", chunk)
+        self.text.configure(state="disabled")
+        job["pos"] = end
+        if data:
+            self._update_status(f"Loading... {min(100, 100 * end // max(job['size'], 1))}%")
+            self.after(1, self._load_next_chunk)
+            return
+        job["file"].close()
+        self._load = None
+        self.text.configure(state="normal", undo=True)
+        self.text.edit_reset()
+        self.text.edit_modified(False)
+        self.text.mark_set("insert", "1.0")
+        self.text.see("1.0")
+        self._text_modified = False
+        self._update_status("Opened")
+        self._offer_recovery()
+
+    def _open_paged(self, fname):
+        if self._find_dialog is not None:
+            self._find_dialog._close()
+        self._paged = LineIndex(fname)
+        self._paged_top = 0
+        self.current_filename = fname
+        self.text.configure(state="normal", wrap="none", undo=False, yscrollcommand=lambda *a: None)
+        self.scrollbar.configure(command=self._paged_yview)
+        self._render_page()
+        self.after(INDEX_POLL_MS, self._poll_index)
+
+    def _visible_lines(self):
+        linespace = tkfont.Font(font=self.text.cget("font")).metrics("linespace")
+        return max(1, self.text.winfo_height() // max(linespace, 1))
+
+    def _render_page(self):
+        index = self._paged
+        rows = self._visible_lines()
+        total = index.line_count()
+        self._paged_top = max(0, min(self._paged_top, total - rows))
+        self.text.configure(state="normal")
         self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", index.read_lines(self._paged_top, rows))
+        self.text.configure(state="disabled")
+        self.text.edit_modified(False)
+        self.scrollbar.set(self._paged_top / total, min(1.0, (self._paged_top + rows) / total))
+        more = "" if index.done else "+ (indexing)"
+        last = min(self._paged_top + rows, total)
+        self._update_status(f"Read-only view — lines {self._paged_top + 1}-{last} of {total}{more}")
+
+    def _poll_index(self):
+        if self._paged is None:
+            return
+        self._render_page()
+        if not self._paged.done:
+            self.after(INDEX_POLL_MS, self._poll_index)
+
+    def _paged_yview(self, *args):
+        if self._paged is None:
+            return
+        total = self._paged.line_count()
+        if args[0] == "moveto":
+            self._paged_top = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self._visible_lines()
+            self._paged_top += amount
+        self._render_page()
+
+    def _on_paged_scroll(self, lines):
+        if self._paged is None:
+            return None
+        if lines == "home":
+            self._paged_top = 0
+        elif lines == "end":
+            self._paged_top = self._paged.line_count()
+        elif lines in ("page-", "page+"):
+            self._paged_top += self._visible_lines() * (1 if lines == "page+" else -1)
+        else:
+            self._paged_top += lines
+        self._render_page()
+        return "break"
+
+    def _confirm_discard(self, proceed):
+        if self._save is not None:
+            self._update_status("Please wait for the save to finish")
+            return
+        if not self._text_modified:
+            proceed()
+            return
+        dlg = SaveBeforeCloseDialog(self, filename=self.current_filename)
+        self.wait_window(dlg)
+        if dlg.result == "save":
+            self.save_file(on_done=proceed)
+        elif dlg.result == "dont_save":
+            proceed()
+
+    def new_file(self):
+        self._confirm_discard(self._new_file)
+
+    def _new_file(self):
+        self._discard_swap()
+        self._close_large_file()
+        self._set_text("")
         self.current_filename = None
         self._text_modified = False
         self._update_status("New file")
 
     def open_file(self):
-        if self._text_modified:
-            dlg = SaveBeforeCloseDialog(self, filename=self.current_filename)
-            self.wait_window(dlg)
-            if dlg.result == "save":
-                if not self.save_file():
-                    return
-            elif dlg.result == "cancel":
-                return
+        self._confirm_discard(self._open_file)
+
+    def _open_file(self):
         fname = simpledialog.askstring("Open", "Enter file name to open (relative or absolute):", parent=self)
         if not fname:
             self._update_status("Open cancelled")
@@ -129,21 +715,43 @@ class TextEditorApp(tk.Tk):
                 self._update_status("Open cancelled (file not found)")
                 return
         try:
+            self._discard_swap()
+            self._close_large_file()
+            size = os.path.getsize(fname) if os.path.exists(fname) else 0
+            if size >= PAGED_VIEW_BYTES and messagebox.askyesno(
+                    "Large file", f"'{os.path.basename(fname)}' is {size // (1024 * 1024)} MB.\n\n"
+                    "Open it in a read-only paged view? Choose No to load it fully for editing.", parent=self):
+                self._open_paged(fname)
+                return
+            if size >= LARGE_FILE_BYTES:
+                self._load_chunked(fname)
+                return
             if os.path.exists(fname):
                 with open(fname, "r", encoding="utf-8") as f:
                     content = f.read()
             else:
                 content = ""
-            self.text.delete("1.0", tk.END)
-            self.text.insert(tk.END, content)
+            self._set_text(content)
             self.current_filename = fname
             self._text_modified = False
             self._update_status("Opened")
+            self._offer_recovery()
         except Exception as e:
             messagebox.showerror("Error opening file", str(e), parent=self)
             self._update_status("Open failed")
 
-    def save_file(self):
+    def save_file(self, on_done=None):
+        if self._save is not None:
+            self._update_status("Save already in progress")
+            return False
+        if self._paged is not None:
+            self._update_status("Read-only view — nothing to save")
+            if on_done:
+                on_done()
+            return True
+        if self._load is not None:
+            self._update_status("Still loading")
+            return False
         if not self.current_filename:
             fname = simpledialog.askstring("Save", "Enter file name to save as (relative or absolute):", parent=self)
             if not fname:
@@ -152,20 +760,97 @@ class TextEditorApp(tk.Tk):
             if not os.path.isabs(fname):
                 fname = os.path.abspath(fname)
             self.current_filename = fname
+        target = self.current_filename
         try:
-            with open(self.current_filename, "w", encoding="utf-8") as f:
-                f.write(self.text.get("1.0", tk.END))
-            self._text_modified = False
-            self._update_status("Saved")
-            return True
-        except Exception as e:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target),
+                                            prefix=f".{os.path.basename(target)}.", suffix=".tmp")
+        except OSError as e:
             messagebox.showerror("Error saving file", str(e), parent=self)
             self._update_status("Save failed")
             return False
+        chunks = queue.Queue(maxsize=SAVE_QUEUE_CHUNKS)
+        result = queue.Queue()
+        last_line = int(self.text.index("end-1c").split(".")[0])
+        self._save = {"target": target, "chunks": chunks, "result": result, "next_line": 1,
+                      "last_line": last_line, "on_done": on_done}
+        threading.Thread(target=self._save_worker, args=(fd, tmp_path, target, chunks, result),
+                         daemon=True).start()
+        self.text.configure(state="disabled")
+        self._update_status("Saving...")
+        self._save_next_chunk()
+        return True
+
+    def _save_next_chunk(self):
+        job = self._save
+        while job["next_line"] is not None and not job["chunks"].full():
+            start = job["next_line"]
+            stop = start + SAVE_CHUNK_LINES
+            if stop > job["last_line"]:
+                job["chunks"].put(self.text.get(f"{start}.0", tk.END))
+                job["chunks"].put(None)
+                job["next_line"] = None
+            else:
+                job["chunks"].put(self.text.get(f"{start}.0", f"{stop}.0"))
+                job["next_line"] = stop
+        if job["next_line"] is not None:
+            self._update_status(f"Saving... {100 * job['next_line'] // job['last_line']}%")
+        try:
+            error = job["result"].get_nowait()
+        except queue.Empty:
+            self.after(SAVE_POLL_MS, self._save_next_chunk)
+            return
+        self._save = None
+        self.text.configure(state="normal")
+        if error is not None:
+            messagebox.showerror("Error saving file", error, parent=self)
+            self._update_status("Save failed")
+            return
+        self._text_modified = False
+        self._discard_swap()
+        self._update_status("Saved")
+        if job["on_done"]:
+            job["on_done"]()
+
+    @staticmethod
+    def _save_worker(fd, tmp_path, target, chunks, result):
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                while True:
+                    chunk = chunks.get()
+                    if chunk is None:
+                        break
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+            if os.path.exists(target):
+                os.chmod(tmp_path, os.stat(target).st_mode & 0o7777)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, target)
+            if hasattr(os, "O_DIRECTORY"):
+                dir_fd = os.open(os.path.dirname(target), os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+        except Exception as e:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            result.put(str(e))
+        else:
+            result.put(None)
 
     def exit_app(self):
+        if self._save is not None:
+            self._update_status("Please wait for the save to finish")
+            return
         if not self._text_modified:
             if messagebox.askokcancel("Exit", "Are you sure you want to exit?", parent=self):
+                self._discard_swap()
                 self.destroy()
             else:
                 self._update_status("Exit cancelled")
@@ -173,11 +858,10 @@ class TextEditorApp(tk.Tk):
         dlg = SaveBeforeCloseDialog(self, filename=self.current_filename)
         self.wait_window(dlg)
         if dlg.result == "save":
-            if self.save_file():
-                self.destroy()
-            else:
+            if not self.save_file(on_done=self.destroy):
                 self._update_status("Exit cancelled (save failed)")
         elif dlg.result == "dont_save":
+            self._discard_swap()
             self.destroy()
         else:
             self._update_status("Exit cancelled")
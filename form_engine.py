@@ -0,0 +1,342 @@
+import tkinter as tk
+from tkinter import ttk
+import re
+
+EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+VALIDATION_DELAY_MS = 300
+MEMO_SIZE = 256
+ERROR_BG = "#ffd6d6"
+ROW_HEIGHT = 30
+BUILD_MARGIN = 200
+MULTILINE_HEIGHT = 5
+
+def is_email(value):
+    return bool(EMAIL_RE.fullmatch(value.strip()))
+
+def is_number(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+class Rule:
+    def __init__(self, check, message, expensive=False):
+        self.check = check
+        self.message = message
+        self.expensive = expensive
+
+class Validator:
+    def __init__(self, widget, rules, on_change):
+        self.widget = widget
+        self.rules = rules
+        self.on_change = on_change
+        self.states = {field: (False, "", "") for field in rules}
+        self.invalid = set(rules)
+        self._memo = {field: {} for field in rules}
+        self._jobs = {}
+
+    def _run(self, field, value, expensive):
+        memo = self._memo[field]
+        key = (value, expensive)
+        if key not in memo:
+            result = (True, "")
+            for rule in self.rules[field]:
+                if rule.expensive == expensive and not rule.check(value):
+                    result = (False, rule.message)
+                    break
+            if len(memo) >= MEMO_SIZE:
+                memo.clear()
+            memo[key] = result
+        return memo[key]
+
+    def _cancel(self, field):
+        job = self._jobs.pop(field, None)
+        if job is not None:
+            self.widget.after_cancel(job)
+
+    def validate(self, field, value):
+        self._cancel(field)
+        ok, message = self._run(field, value, False)
+        if ok and any(rule.expensive for rule in self.rules[field]):
+            if (value, True) in self._memo[field]:
+                ok, message = self._memo[field][(value, True)]
+            else:
+                ok = None
+                self._jobs[field] = self.widget.after(VALIDATION_DELAY_MS, lambda: self._finish(field, value))
+        self._set(field, value, ok, message)
+
+    def validate_now(self, field, value):
+        self._cancel(field)
+        ok, message = self._run(field, value, False)
+        if ok:
+            ok, message = self._run(field, value, True)
+        self._set(field, value, ok, message)
+        return ok
+
+    def _finish(self, field, value):
+        self._jobs.pop(field, None)
+        ok, message = self._run(field, value, True)
+        self._set(field, value, ok, message)
+
+    def invalidate(self, field):
+        self._memo[field].clear()
+
+    def _set(self, field, value, ok, message):
+        state = (ok, message, value)
+        if self.states[field] == state:
+            return
+        self.states[field] = state
+        if ok:
+            self.invalid.discard(field)
+        else:
+            self.invalid.add(field)
+        self.on_change(field)
+
+    def all_valid(self):
+        return not self.invalid
+
+def _optional(check):
+    return lambda value: not value.strip() or check(value)
+
+def schema_rules(field):
+    label = field.get("label", field["name"]).rstrip(":")
+    checks = []
+    kind = field.get("type", "text")
+    if kind == "email":
+        checks.append(Rule(is_email, field.get("message", "Enter a valid email address (e.g. user@example.com).")))
+    elif kind == "number":
+        checks.append(Rule(is_number, field.get("message", f"{label} must be a number.")))
+    if "pattern" in field:
+        pattern = re.compile(field["pattern"])
+        checks.append(Rule(lambda v: bool(pattern.fullmatch(v.strip())), field.get("message", f"{label} is not valid.")))
+    if field.get("required"):
+        return [Rule(lambda v: bool(v.strip()), field.get("required_message", f"{label} cannot be empty."))] + checks
+    return [Rule(_optional(rule.check), rule.message) for rule in checks]
+
+def schema_sections(schema):
+    if "sections" in schema:
+        return schema["sections"]
+    return [{"title": None, "fields": schema.get("fields", [])}]
+
+class _Section:
+    def __init__(self, form, spec):
+        self.form = form
+        self.fields = spec["fields"]
+        self.title = spec.get("title")
+        self.expanded = not (self.title and spec.get("collapsed", False))
+        self.body = None
+        self.header = None
+        if self.title:
+            self.header = ttk.Button(form.inner, command=self.toggle)
+            self.header.pack(fill="x", pady=(4, 0))
+            self._update_header()
+        height = sum(ROW_HEIGHT * (MULTILINE_HEIGHT if f.get("type") == "multiline" else 1) for f in self.fields)
+        self.placeholder = ttk.Frame(form.inner, height=height)
+        if self.expanded:
+            self.placeholder.pack(fill="x")
+
+    def _update_header(self):
+        arrow = "▾" if self.expanded else "▸"
+        self.header.config(text=f"{arrow} {self.title} ({len(self.fields)} fields)")
+
+    def toggle(self):
+        self.expanded = not self.expanded
+        self._update_header()
+        widget = self.body if self.body is not None else self.placeholder
+        if self.expanded:
+            widget.pack(fill="x", after=self.header)
+            self.build()
+        else:
+            widget.pack_forget()
+
+    def build(self):
+        if self.body is not None:
+            return
+        form = self.form
+        self.body = ttk.Frame(form.inner, padding=(0, 4))
+        for row, field in enumerate(self.fields):
+            form.build_field(self.body, row, field)
+        self.body.columnconfigure(1, weight=1)
+        if self.expanded:
+            self.body.pack(fill="x", before=self.placeholder)
+        self.placeholder.destroy()
+
+    def is_visible(self, top, bottom):
+        if not self.expanded or self.body is not None:
+            return False
+        y = self.placeholder.winfo_y()
+        return y <= bottom + BUILD_MARGIN and y + self.placeholder.winfo_reqheight() >= top - BUILD_MARGIN
+
+class SchemaForm(ttk.Frame):
+    def __init__(self, master, schema, rules=None, on_submit=None, submit_text="Submit", **kwargs):
+        super().__init__(master, **kwargs)
+        self.schema = schema
+        self.on_submit = on_submit
+        self.specs = {}
+        self.values = {}
+        self.vars = {}
+        self.widgets = {}
+        self._shown = {}
+        self._build_job = None
+        sections = schema_sections(schema)
+        field_rules = {}
+        for section in sections:
+            for field in section["fields"]:
+                name = field["name"]
+                self.specs[name] = field
+                self.values[name] = field.get("default", "")
+                field_rules[name] = schema_rules(field) + list((rules or {}).get(name, []))
+        self.order = {name: i for i, name in enumerate(self.specs)}
+        self.errors = set()
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.inner = ttk.Frame(self.canvas)
+        self._window = self.canvas.create_window((0, 0), window=self.inner, anchor="nw")
+        self.inner.bind("<Configure>", self._on_inner_configure)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        self.canvas.bind("<Enter>", lambda e: self.canvas.bind_all("<MouseWheel>", self._on_wheel))
+        self.canvas.bind("<Leave>", lambda e: self.canvas.unbind_all("<MouseWheel>"))
+
+        self.msg_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.msg_var, foreground="red").grid(row=1, column=0, columnspan=2, sticky="w", pady=(2, 8))
+        self.submit_btn = ttk.Button(self, text=submit_text, command=self.submit, state="disabled")
+        self.submit_btn.grid(row=2, column=0, columnspan=2, pady=(6, 0))
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.validator = Validator(self, field_rules, self._on_field_change)
+        self.sections = [_Section(self, spec) for spec in sections]
+        for section in self.sections:
+            if section.expanded:
+                section.build()
+                break
+        for name, value in self.values.items():
+            self.validator.validate(name, value)
+        self._schedule_build()
+
+    def build_field(self, parent, row, field):
+        name = field["name"]
+        ttk.Label(parent, text=field.get("label", name)).grid(row=row, column=0, sticky="nw", padx=(0, 8), pady=(0, 6))
+        if field.get("type") == "multiline":
+            widget = tk.Text(parent, height=MULTILINE_HEIGHT, width=field.get("width", 40), wrap="word")
+            widget.insert("1.0", self.values[name])
+            widget.edit_modified(False)
+            widget.bind("<<Modified>>", lambda e, n=name, w=widget: self._on_text_modified(n, w))
+        else:
+            var = tk.StringVar(value=self.values[name])
+            widget = tk.Entry(parent, textvariable=var, width=field.get("width", 40))
+            var.trace_add("write", lambda *a, n=name, v=var: self._on_value(n, v.get()))
+            self.vars[name] = var
+        widget.grid(row=row, column=1, sticky="we", pady=(0, 6))
+        self.widgets[name] = widget
+        self._shown.pop(name, None)
+        self._on_field_change(name)
+
+    def _on_text_modified(self, name, widget):
+        if widget.edit_modified():
+            widget.edit_modified(False)
+            self._on_value(name, widget.get("1.0", "end-1c"))
+
+    def _on_value(self, name, value):
+        self.values[name] = value
+        self.validator.validate(name, value)
+
+    def _show(self, key, value, apply):
+        if self._shown.get(key) != value:
+            self._shown[key] = value
+            apply(value)
+
+    def _on_field_change(self, name):
+        ok, message, value = self.validator.states[name]
+        if ok is False and value != "":
+            self.errors.add(name)
+        else:
+            self.errors.discard(name)
+        widget = self.widgets.get(name)
+        if widget is not None:
+            bg = "white" if ok is not False or value == "" else ERROR_BG
+            self._show(name, bg, lambda color: widget.config(bg=color))
+        first = min(self.errors, key=self.order.get) if self.errors else None
+        self._show("message", self.validator.states[first][1] if first else "", self.msg_var.set)
+        state = "normal" if self.validator.all_valid() else "disabled"
+        self._show("submit", state, lambda s: self.submit_btn.config(state=s))
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_build()
+
+    def _on_inner_configure(self, event):
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        if self.inner.winfo_reqheight() > self.canvas.winfo_height():
+            self.scrollbar.grid(row=0, column=1, sticky="ns")
+        else:
+            self.scrollbar.grid_remove()
+        self._schedule_build()
+
+    def _on_canvas_configure(self, event):
+        self.canvas.itemconfigure(self._window, width=event.width)
+        self._schedule_build()
+
+    def _on_wheel(self, event):
+        self.canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+
+    def _schedule_build(self):
+        if self._build_job is None:
+            self._build_job = self.after_idle(self._build_visible)
+
+    def _build_visible(self):
+        self._build_job = None
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        for section in self.sections:
+            if section.is_visible(top, bottom):
+                section.build()
+
+    def get_values(self):
+        return dict(self.values)
+
+    def check(self):
+        for name in self.specs:
+            if not self.validator.validate_now(name, self.values[name]):
+                return self.validator.states[name][1] or f"{name} is not valid yet."
+        return None
+
+    def set_value(self, name, value):
+        widget = self.widgets.get(name)
+        if name in self.vars:
+            self.vars[name].set(value)
+        elif widget is not None:
+            widget.delete("1.0", "end")
+            widget.insert("1.0", value)
+        else:
+            self._on_value(name, value)
+
+    def reset(self):
+        for name, field in self.specs.items():
+            self.set_value(name, field.get("default", ""))
+
+    def submit(self):
+        if str(self.submit_btn["state"]) == "normal" and self.on_submit is not None:
+            self.on_submit(self.get_values())
+
+def demo_schema(sections=50, fields_per_section=10):
+    return {"sections": [
+        {"title": f"Section {s + 1}", "collapsed": s > 0, "fields": [
+            {"name": f"s{s}_f{f}", "label": f"Field {s * fields_per_section + f + 1}:",
+             "type": ("text", "email", "number")[f % 3], "required": f == 0}
+            for f in range(fields_per_section)
+        ]}
+        for s in range(sections)
+    ]}
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Schema Form Demo — 500 fields")
+    root.geometry("520x600")
+    form = SchemaForm(root, demo_schema(), on_submit=lambda values: print(values), padding=12)
+    form.pack(fill="both", expand=True)
+    root.mainloop()
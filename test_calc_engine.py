@@ -0,0 +1,89 @@
+from fractions import Fraction
+
+import pytest
+
+from calc_engine import BINARY, CONST, LOAD, NEG, CalcError, evaluate, evaluate_csv, format_result, parse, tokenize
+
+def test_tokenize():
+    assert tokenize("1.5 + x**2") == [
+        ("num", Fraction(3, 2)), ("op", "+"), ("name", "x"), ("op", "**"), ("num", Fraction(2)), ("end", None),
+    ]
+    assert tokenize(".5e1 // 2") == [("num", Fraction(5)), ("op", "//"), ("num", Fraction(2)), ("end", None)]
+
+def test_tokenize_rejects_unknown_characters():
+    with pytest.raises(CalcError, match="Unexpected character '\\$'"):
+        tokenize("1 + $")
+
+def test_constants_are_folded():
+    assert parse("2 * (3 + 4) - -1").code == ((CONST, Fraction(15)),)
+
+def test_variables_are_compiled():
+    program = parse("-a + 2 * 3")
+    assert program.names == ("a",)
+    assert program.code == ((LOAD, "a"), (NEG, None), (CONST, Fraction(6)), (BINARY, "+"))
+
+def test_precedence_and_associativity():
+    assert evaluate("2 + 3 * 4") == 14
+    assert evaluate("2 ** 3 ** 2") == 512
+    assert evaluate("-2 ** 2") == -4
+    assert evaluate("10 - 4 - 3") == 3
+    assert evaluate("x / 4", {"x": Fraction(1)}) == Fraction(1, 4)
+
+def test_results_are_exact():
+    assert format_result(evaluate("0.1 + 0.2")) == "0.3"
+    assert format_result(evaluate("1 / 3")) == "0.33333333333333333333"
+
+@pytest.mark.parametrize("expr, message", [
+    ("3 4", "Unexpected '4'"),
+    ("2 x", "Unexpected 'x'"),
+    ("1)", "Unexpected '\\)'"),
+    ("*2", "Unexpected '\\*'"),
+    ("(1", "Missing closing parenthesis"),
+    ("1 +", "Incomplete expression"),
+    ("2 ** 0.5", "Exponent must be a whole number"),
+    ("(" * 5000 + "1" + ")" * 5000, "nested too deeply"),
+    ("-" * 5000 + "1", "nested too deeply"),
+])
+def test_errors(expr, message):
+    with pytest.raises(CalcError, match=message):
+        evaluate(expr)
+
+def test_huge_exponents_are_rejected_before_expanding():
+    with pytest.raises(CalcError, match="Exponent too large"):
+        tokenize("1e999999999")
+    with pytest.raises(CalcError, match="Exponent too large"):
+        tokenize("2.5E-" + "9" * 400)
+    assert tokenize("1e4096")[0] == ("num", Fraction(10) ** 4096)
+
+def test_overlong_numbers_are_rejected():
+    with pytest.raises(CalcError, match="too many digits"):
+        tokenize("1" * 5000)
+
+def test_results_beyond_the_str_digit_limit_use_scientific_notation():
+    assert format_result(evaluate("99 ** 4096")) == "1.3236009541645229961E+8174"
+    assert format_result(evaluate("-(99 ** 4096)")) == "-1.3236009541645229961E+8174"
+    assert format_result(evaluate("10 ** 30")) == "1" + "0" * 30
+
+def test_unknown_variable():
+    with pytest.raises(CalcError, match="Unknown variable 'y'"):
+        evaluate("y + 1")
+
+def test_division_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        evaluate("1 / 0")
+
+def test_batch_folds_constants_as_floats(tmp_path):
+    src = tmp_path / "in.csv"
+    out = tmp_path / "out.csv"
+    src.write_text("a\n2\n-1\n", encoding="utf-8")
+    assert evaluate_csv("2**0.5*a + 1/0", src, out) == 2
+    assert out.read_text(encoding="utf-8").splitlines() == ["a,result", "2,inf", "-1,inf"]
+
+def test_batch_leaves_output_alone_on_bad_header(tmp_path):
+    src = tmp_path / "in.csv"
+    out = tmp_path / "out.csv"
+    src.write_text("a\n1\n", encoding="utf-8")
+    out.write_text("previous", encoding="utf-8")
+    with pytest.raises(CalcError, match="Missing column"):
+        evaluate_csv("b + 1", src, out)
+    assert out.read_text(encoding="utf-8") == "previous"
@@ -0,0 +1,143 @@
+import io
+import sqlite3
+
+import pytest
+
+from contact_store import (
+    MIGRATIONS, NAME_WINDOW, ContactReader, ContactStore, canonical_email, canonical_phone, duplicate_clusters,
+    export_contacts, iter_csv, iter_vcard,
+)
+
+@pytest.fixture
+def store(tmp_path):
+    store = ContactStore(str(tmp_path / "contacts.db"))
+    yield store
+    store.close()
+
+@pytest.mark.parametrize("phone, key", [
+    ("+1 (555) 123-4567", "5551234567"),
+    ("001 555 123 4567", "5551234567"),
+    ("+44 20 7946 0958", "2079460958"),
+    ("020 7946 0958", "2079460958"),
+    ("555-1234", "5551234"),
+    ("123", None),
+    ("", None),
+])
+def test_canonical_phone(phone, key):
+    assert canonical_phone(phone) == key
+
+@pytest.mark.parametrize("email, key", [
+    (" A.B@Example.com ", "a.b@example.com"),
+    ("a.b+news@example.com", "a.b@example.com"),
+    ("J.Doe+news@GoogleMail.com", "jdoe@gmail.com"),
+    ("nobody", None),
+    ("x@localhost", None),
+    ("@example.com", None),
+])
+def test_canonical_email(email, key):
+    assert canonical_email(email) == key
+
+def test_duplicate_clusters_separates_exact_and_similar():
+    contacts = [
+        ("Jon Smith", "555 123 4567", "a@example.com"),
+        ("John Smith", "+1 555-123-4567", "b@example.com"),
+        ("Jane Doe", "1", "jane.doe@gmail.com"),
+        ("J Doe", "2", "janedoe+x@googlemail.com"),
+        ("Jon Smyth", "3", "c@example.com"),
+        ("Alice Jones", "4", "d@example.com"),
+    ]
+    exact, similar = duplicate_clusters(contacts)
+    assert exact == [[0, 1], [2, 3]]
+    # Only the first record of an exact cluster takes part in the name pass.
+    assert similar == [[0, 4]]
+
+def test_duplicate_clusters_covers_blocks_larger_than_the_window():
+    contacts = [("John Smith", str(i), f"u{i}@example.com") for i in range(NAME_WINDOW * 3)]
+    contacts.append(("Smith Jon", "x", "typo@example.com"))
+    contacts.append(("Mary Brown", "y", "mary@example.com"))
+    exact, similar = duplicate_clusters(contacts)
+    assert exact == []
+    assert similar == [list(range(NAME_WINDOW * 3 + 1))]
+
+def test_find_duplicate_uses_canonical_keys(store):
+    first = store.add("Ann", "+1 555 123 4567", "Ann.Lee+home@gmail.com")
+    assert store.find_duplicate("(555) 123-4567", "other@example.com") == first
+    assert store.find_duplicate("999 9999", "annlee@googlemail.com") == first
+    assert store.find_duplicate("555 123 4567", "annlee@gmail.com", exclude=first) is None
+    store.update(first, "Ann", "777 0000", "ann@example.com")
+    assert store.find_duplicate("555 123 4567", "annlee@gmail.com") is None
+    store.delete(first)
+    assert store.find_duplicate("777 0000", "ann@example.com") is None
+
+def test_short_phones_never_match(store):
+    store.add("Ann", "12", "ann@example.com")
+    assert store.find_duplicate("12", "someone@example.com") is None
+
+def test_find_duplicate_groups_reports_contact_ids(store):
+    ids = [store.add(*contact) for contact in [
+        ("Jon Smith", "555 123 4567", "a@example.com"),
+        ("Mary Brown", "555 000 1111", "mary@example.com"),
+        ("John Smith", "+1 555-123-4567", "b@example.com"),
+        ("Jon Smyth", "555 222 3333", "c@example.com"),
+    ]]
+    assert store.find_duplicate_groups() == ([[ids[0], ids[2]]], [[ids[0], ids[3]]])
+
+def test_migration_backfills_canonical_keys(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(MIGRATIONS[0] + "PRAGMA user_version = 1;")
+    conn.execute(
+        "INSERT INTO contacts (name, phone, email, name_key, phone_key, email_key) VALUES (?, ?, ?, ?, ?, ?)",
+        ("Ann", "+1 555 123 4567", "ann@example.com", "ann", "15551234567", "ann@example.com"),
+    )
+    conn.commit()
+    conn.close()
+    store = ContactStore(path)
+    try:
+        assert store.find_duplicate("555-123-4567", "") == 1
+        assert store.find_duplicate("", "ANN@example.com") == 1
+    finally:
+        store.close()
+
+def test_iter_csv_maps_header_columns():
+    f = io.StringIO("Email, NAME ,phone\nann@example.com, Ann ,555\n\n,,\nbob@example.com,Bob\n")
+    assert list(iter_csv(f)) == [("Ann", "555", "ann@example.com"), ("Bob", "", "bob@example.com")]
+
+def test_iter_csv_without_header_keeps_the_first_row():
+    f = io.StringIO("Ann,555,ann@example.com\nBob,556\n")
+    assert list(iter_csv(f)) == [("Ann", "555", "ann@example.com"), ("Bob", "556", "")]
+    assert list(iter_csv(io.StringIO(""))) == []
+
+def test_iter_vcard_unfolds_lines_and_unescapes_values():
+    text = (
+        "BEGIN:VCARD\r\nVERSION:3.0\r\nN:Lee;Ann;Marie;;\r\nTEL;TYPE=CELL:+1 555\r\n 123 4567\r\n"
+        "item1.EMAIL:ann@exa\r\n\tmple.com\r\nEMAIL:second@example.com\r\nEND:VCARD\r\n"
+        "BEGIN:VCARD\r\nFN:Smith\\, John\\nJr\\;\\\\\r\nN:Smith;John;;;\r\nEND:VCARD\r\n"
+        "FN:outside any card\r\n"
+    )
+    assert list(iter_vcard(io.StringIO(text, newline=""))) == [
+        ("Ann Marie Lee", "+1 555123 4567", "ann@example.com"),
+        ("Smith, John\nJr;\\", "", ""),
+    ]
+
+@pytest.mark.parametrize("filename", ["contacts.csv", "contacts.vcf"])
+def test_export_round_trips_through_the_reader(store, tmp_path, filename):
+    rows = [("Lee, Ann", "+1 555 123 4567", "ann@example.com"), ("Bob; \"B\"\nJr", "556", "bob@example.com")]
+    store.add_many(rows)
+    path = str(tmp_path / filename)
+    assert export_contacts(store, path) == 2
+    reader = ContactReader(path)
+    try:
+        assert list(reader.records) == [rows[1], rows[0]]
+        assert reader.progress() == 1.0
+    finally:
+        reader.close()
+
+def test_reader_skips_a_byte_order_mark(tmp_path):
+    path = tmp_path / "contacts.csv"
+    path.write_bytes("\ufeffname,phone,email\nAnn,555,ann@example.com\n".encode("utf-8"))
+    reader = ContactReader(str(path))
+    try:
+        assert list(reader.records) == [("Ann", "555", "ann@example.com")]
+    finally:
+        reader.close()
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+import To_Do_List as todo
+from To_Do_List import COMPACTING_FILE, JOURNAL_FILE, SNAPSHOT_TMP, TASKS_FILE
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    if todo.journal is not None and not todo.journal.closed:
+        todo.journal.close()
+    todo.journal = None
+
+def write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def test_replay_journal_applies_ops_in_order():
+    write(JOURNAL_FILE, "A\tone\nA\ttwo\nA\tthree\nD\t0\nD\t9\n")
+    tasks = []
+    assert todo.replay_journal(JOURNAL_FILE, tasks) == 5
+    assert tasks == ["two", "three"]
+
+def test_replay_journal_clear_drops_earlier_tasks():
+    write(JOURNAL_FILE, "A\tone\nC\t\nA\ttwo\n")
+    tasks = ["from snapshot"]
+    todo.replay_journal(JOURNAL_FILE, tasks)
+    assert tasks == ["two"]
+
+def test_replay_journal_stops_at_a_torn_last_line():
+    write(JOURNAL_FILE, "A\tkept\nA\tcut off mid-wr")
+    tasks = []
+    assert todo.replay_journal(JOURNAL_FILE, tasks) == 1
+    assert tasks == ["kept"]
+
+def test_read_tasks_combines_snapshot_and_journal():
+    write(TASKS_FILE, "one\ntwo\n")
+    write(JOURNAL_FILE, "A\tthree\nD\t0\n")
+    assert todo.read_tasks() == (["two", "three"], 2)
+
+def test_read_tasks_recovers_from_crash_before_snapshot_rename():
+    # The journal was moved aside but the new snapshot never replaced tasks.txt.
+    write(TASKS_FILE, "one\n")
+    write(COMPACTING_FILE, "A\ttwo\n")
+    write(SNAPSHOT_TMP, "one\ntwo\n")
+    write(JOURNAL_FILE, "A\tthree\n")
+    assert todo.read_tasks() == (["one", "two", "three"], 2)
+
+def test_read_tasks_ignores_compacted_journal_after_snapshot_rename():
+    # tasks.txt already holds the compacted ops; only removing the old journal was left.
+    write(TASKS_FILE, "one\ntwo\n")
+    write(COMPACTING_FILE, "A\ttwo\n")
+    assert todo.read_tasks() == (["one", "two"], 0)
+
+def test_write_snapshot_replaces_tasks_and_starts_a_new_journal():
+    write(TASKS_FILE, "old\n")
+    todo.open_journal()
+    todo.write_ops([("A", "new")])
+    todo.write_snapshot(["old", "new"])
+    todo.write_ops([("A", "after")])
+    todo.journal.close()
+    assert not os.path.exists(COMPACTING_FILE)
+    assert not os.path.exists(SNAPSHOT_TMP)
+    assert todo.read_tasks() == (["old", "new", "after"], 1)
+
+def test_back_up_unreadable_moves_every_file_aside():
+    with open(TASKS_FILE, "wb") as f:
+        f.write(b"\xff\xfe not utf-8\n")
+    write(JOURNAL_FILE, "A\ty\n")
+    with pytest.raises(ValueError):
+        todo.read_tasks()
+    moved = todo.back_up_unreadable()
+    assert len(moved) == 2
+    assert all(".unreadable-" in path for path in moved)
+    assert not os.path.exists(TASKS_FILE) and not os.path.exists(JOURNAL_FILE)
+    assert todo.read_tasks() == ([], 0)
@@ -0,0 +1,126 @@
+import pytest
+
+from todo_sqlite_app import TaskDB
+
+@pytest.fixture
+def db(tmp_path):
+    db = TaskDB(str(tmp_path / "tasks.db"))
+    yield db
+    db.close()
+
+def _plan(db, call):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db.conn.set_trace_callback(None)
+    select = next(sql for sql in statements if sql.lstrip().startswith("SELECT"))
+    return " ".join(row[3] for row in db.conn.execute("EXPLAIN QUERY PLAN " + select))
+
+def test_sorted_pages_follow_the_sort_key(db):
+    for i in range(10):
+        task_id = db.add_task(f"task {i}")[0]
+        db.set_schedule(task_id, i % 3, f"2024-01-{10 - i:02d}" if i % 2 else None)
+    first = db.get_sorted_page("priority", limit=4)
+    assert [row[3] for row in first] == [2, 2, 2, 1]
+    rest = db.get_sorted_page("priority", after=(first[-1][3], first[-1][0]), limit=10)
+    assert len(first) + len(rest) == 10
+    assert [(row[3], row[0]) for row in first + rest] == sorted(((row[3], row[0]) for row in first + rest), reverse=True)
+    due = db.get_sorted_page("due")
+    assert [row[3] for row in due] == sorted(row[3] for row in due)
+    assert len(due) == 5
+
+@pytest.mark.parametrize("order, after", [("priority", None), ("priority", (1, 5)), ("due", ("2024-01-01", 5))])
+def test_sorted_pages_read_only_the_covering_index(db, order, after):
+    plan = _plan(db, lambda: db.get_sorted_page(order, after=after))
+    assert "COVERING INDEX" in plan
+
+def test_import_skips_duplicates_and_indexes_for_search(db):
+    db.add_task("buy milk")
+    rows = [("buy milk", 0), ("walk the dog", 1), ("water plants", 0), ("walk the dog", 0)]
+    assert db.import_rows(rows, batch_size=2) == (4, 2)
+    assert [row[1] for row in db.search("wa")] == ["water plants", "walk the dog"]
+    assert db.get(db.search("walk")[0][0])[2] == 1
+
+def test_import_logs_one_reload_marker_per_batch(db):
+    start = db.last_change_seq()
+    db.import_rows(((f"task {i}", 0) for i in range(5)), batch_size=2)
+    ops = [op for (op,) in db.conn.execute("SELECT op FROM task_changes WHERE seq > ?", (start,))]
+    assert ops == ["r", "r", "r"]
+
+def test_import_leaves_other_connections_triggers_alone(db):
+    other = TaskDB(db.path)
+    try:
+        rows = iter([("imported", 0)])
+        db._bulk_import = True
+        try:
+            other.add_task("typed elsewhere")
+        finally:
+            db._bulk_import = False
+        db.import_next(rows)
+        assert [row[1] for row in db.search("typed")] == ["typed elsewhere"]
+        assert db.conn.execute("SELECT op FROM task_changes ORDER BY seq").fetchall() == [("i",), ("r",)]
+    finally:
+        other.close()
+
+@pytest.fixture
+def pair(db):
+    other = TaskDB(db.path)
+    yield db, other
+    other.close()
+
+def test_changes_since_skips_own_writes(pair):
+    db, other = pair
+    seq = db.last_change_seq()
+    own = db.add_task("mine")
+    db.toggle_status(own[0])
+    theirs = other.add_task("theirs")
+    seq, changes, reload = db.changes_since(seq)
+    assert not reload
+    assert changes == [("i", theirs[0], theirs)]
+    assert db.changes_since(seq) == (seq, [], False)
+
+def test_changes_since_reports_updates_and_deletes(pair):
+    db, other = pair
+    task_id = db.add_task("shared")[0]
+    seq = db.last_change_seq()
+    other.update_task(task_id, "shared edit")
+    other.delete_task(task_id)
+    seq, changes, reload = db.changes_since(seq)
+    assert not reload
+    assert [(op, tid) for op, tid, _ in changes] == [("u", task_id), ("d", task_id)]
+    assert all(row is None for _, _, row in changes)
+
+def test_changes_since_advances_past_own_writes(pair):
+    db, other = pair
+    seq = db.last_change_seq()
+    for i in range(300):
+        db.add_task(f"local {i}")
+    seq, changes, reload = db.changes_since(seq)
+    assert (changes, reload) == ([], False)
+    assert seq == db.last_change_seq()
+
+def test_changes_since_asks_for_reload_after_import(pair):
+    db, other = pair
+    seq = db.last_change_seq()
+    other.import_rows([("bulk", 0)])
+    _, changes, reload = db.changes_since(seq)
+    assert (changes, reload) == ([], True)
+
+def test_changes_since_asks_for_reload_when_log_was_pruned(pair):
+    db, other = pair
+    seq = db.last_change_seq()
+    for i in range(5):
+        other.add_task(f"remote {i}")
+    other.prune_changes(keep=2)
+    _, changes, reload = db.changes_since(seq)
+    assert (changes, reload) == ([], True)
+
+def test_changes_since_asks_for_reload_when_behind_by_more_than_a_page(pair):
+    db, other = pair
+    seq = db.last_change_seq()
+    for i in range(5):
+        other.add_task(f"remote {i}")
+    _, changes, reload = db.changes_since(seq, limit=3)
+    assert (changes, reload) == ([], True)
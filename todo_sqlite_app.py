@@ -2,49 +2,467 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
 import sqlite3
 import os
+import re
+import sys
+import csv
+import json
+import itertools
+import time
+import queue
+import tempfile
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date
+from urllib.request import pathname2url
 
 DB_PATH = "tasks.db"
+PAGE_SIZE = 200
+WINDOW_PAGES = 3
+SCROLL_MARGIN = 0.1
+SEARCH_DELAY_MS = 250
+STATUS_PENDING = 0
+STATUS_DONE = 1
+STATUS_NAMES = {STATUS_PENDING: "pending", STATUS_DONE: "done"}
+STATUS_CODES = {name: code for code, name in STATUS_NAMES.items()}
+STATUS_FILTERS = ("all", "pending", "done")
+SORT_ORDERS = {"priority": ("priority", "DESC"), "due": ("due_date", "ASC")}
+EXPORT_BATCH = 5000
+EXPORT_BUFFER = 1024 * 1024
+POLL_MS = 16
+DISPATCH_BUDGET = 0.008
+ROW_CACHE_SIZE = 2048
+SYNC_MS = 500
+CHANGE_LOG_KEEP = 10000
+CHANGE_INSERT, CHANGE_UPDATE, CHANGE_DELETE, CHANGE_RELOAD = "i", "u", "d", "r"
+DETAIL_COLUMNS = ("id", "task", "status", "priority", "due_date", "created_at", "updated_at")
+IMPORT_BATCH = 10000
+IMPORT_FILETYPES = [("Task files","*.txt *.csv *.jsonl"),("All files","*.*")]
+TXT_LINE_RE = re.compile(r"^\[(DONE|PENDING)\]\s+(.*?)(?:\s+\(id:\d+\))?$")
+FTS_TOKEN_RE = re.compile(r"[^\W_]+")
+EXPORT_FILETYPES = [("Text files","*.txt"),("CSV files","*.csv"),("JSON Lines","*.jsonl"),("All files","*.*")]
+
+DEFAULT_PROFILE = {
+    "journal_mode": "wal",
+    "synchronous": "normal",
+    "cache_size": -16000,
+    "mmap_size": 256 * 1024 * 1024,
+    "temp_store": "memory",
+}
+LEGACY_PROFILE = {}
+MAX_SQL_PARAMS = 500
+NOW_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+TOGGLE_SQL = f"""
+UPDATE tasks SET status = 1 - status, updated_at = {NOW_SQL}
+WHERE {{where}}
+RETURNING id, task, status
+"""
+PROFILE_PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store")
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending'
+    );
+    """,
+    f"""
+    DROP TRIGGER IF EXISTS tasks_fts_ai;
+    DROP TRIGGER IF EXISTS tasks_fts_ad;
+    DROP TRIGGER IF EXISTS tasks_fts_au;
+    DROP INDEX IF EXISTS idx_tasks_status;
+    DROP INDEX IF EXISTS idx_tasks_task;
+    CREATE TEMP TABLE old_seq AS SELECT COALESCE(MAX(seq), 0) AS seq FROM sqlite_sequence WHERE name = 'tasks';
+    CREATE TABLE tasks_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task TEXT NOT NULL,
+        status INTEGER NOT NULL DEFAULT 0,
+        priority INTEGER NOT NULL DEFAULT 0,
+        due_date TEXT,
+        created_at INTEGER NOT NULL DEFAULT ({NOW_SQL}),
+        updated_at INTEGER NOT NULL DEFAULT ({NOW_SQL})
+    );
+    INSERT INTO tasks_new (id, task, status)
+        SELECT id, task, CASE status WHEN 'done' THEN 1 ELSE 0 END FROM tasks;
+    DROP TABLE tasks;
+    ALTER TABLE tasks_new RENAME TO tasks;
+    DELETE FROM sqlite_sequence WHERE name IN ('tasks', 'tasks_new');
+    INSERT INTO sqlite_sequence (name, seq)
+        SELECT 'tasks', MAX((SELECT seq FROM old_seq), (SELECT COALESCE(MAX(id), 0) FROM tasks));
+    DROP TABLE old_seq;
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, id, task);
+    CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority, id, task, status);
+    CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(due_date, id, task, status) WHERE due_date IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS idx_tasks_task ON tasks(task);
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(task, content='tasks', content_rowid='id');
+    INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild');
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks WHEN NOT bulk_import() BEGIN
+        INSERT INTO tasks_fts (rowid, task) VALUES (new.id, new.task);
+    END;
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, task) VALUES ('delete', old.id, old.task);
+    END;
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF task ON tasks BEGIN
+        INSERT INTO tasks_fts (tasks_fts, rowid, task) VALUES ('delete', old.id, old.task);
+        INSERT INTO tasks_fts (rowid, task) VALUES (new.id, new.task);
+    END;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS task_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_id INTEGER NOT NULL,
+        op TEXT NOT NULL
+    );
+    CREATE TRIGGER IF NOT EXISTS tasks_changes_ai AFTER INSERT ON tasks WHEN NOT bulk_import() BEGIN
+        INSERT INTO task_changes (task_id, op) VALUES (new.id, 'i');
+    END;
+    CREATE TRIGGER IF NOT EXISTS tasks_changes_au AFTER UPDATE ON tasks BEGIN
+        INSERT INTO task_changes (task_id, op) VALUES (new.id, 'u');
+    END;
+    CREATE TRIGGER IF NOT EXISTS tasks_changes_ad AFTER DELETE ON tasks BEGIN
+        INSERT INTO task_changes (task_id, op) VALUES (old.id, 'd');
+    END;
+    """,
+]
+
+def status_code(value):
+    if isinstance(value, int):
+        return value
+    return STATUS_CODES[value]
+
+def fts_query(text):
+    terms = text.split()
+    if not terms:
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+def fts_tokens(text):
+    # Mirrors the unicode61 tokenizer: case-folded, diacritics removed,
+    # split on anything that is not a letter or digit.
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return FTS_TOKEN_RE.findall("".join(ch for ch in text if not unicodedata.combining(ch)))
+
+def fts_match(query, text):
+    tokens = fts_tokens(text)
+    for term in query.split():
+        phrase = fts_tokens(term)
+        if not phrase:
+            continue
+        *head, last = phrase
+        if not any(tokens[i:i + len(head)] == head and tokens[i + len(head)].startswith(last)
+                   for i in range(len(tokens) - len(head))):
+            return False
+    return True
+
+class RowCache:
+    def __init__(self, capacity=ROW_CACHE_SIZE):
+        self.capacity = capacity
+        self._rows = OrderedDict()
+
+    def __len__(self):
+        return len(self._rows)
+
+    def get(self, key):
+        row = self._rows.get(key)
+        if row is not None:
+            self._rows.move_to_end(key)
+        return row
+
+    def put(self, key, row):
+        self._rows[key] = row
+        self._rows.move_to_end(key)
+        if len(self._rows) > self.capacity:
+            self._rows.popitem(last=False)
+
+    def invalidate(self, keys):
+        for key in keys:
+            self._rows.pop(key, None)
+
+    def clear(self):
+        self._rows.clear()
 
 class TaskDB:
-    def __init__(self, path=DB_PATH):
+    def __init__(self, path=DB_PATH, profile=None, readonly=False):
         self.path = path
+        self.readonly = readonly
+        self.profile = dict(DEFAULT_PROFILE if profile is None else profile)
+        self._batch_depth = 0
+        self.cache = RowCache()
+        self._data_version = None
+        self._feed_version = None
+        self._bulk_import = False
+        if readonly:
+            uri = f"file:{pathname2url(os.path.abspath(self.path))}?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True)
+            return
         self.conn = sqlite3.connect(self.path)
-        self._create_table()
-
-    def _create_table(self):
-        sql = """
-        CREATE TABLE IF NOT EXISTS tasks (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            task TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'pending'
-        )
-        """
-        self.conn.execute(sql)
-        self.conn.commit()
-
-    def add_task(self, task_text):
+        # The insert triggers call this, so a bulk import on this connection can skip them while
+        # inserts from every other connection keep firing them.
+        self.conn.create_function("bulk_import", 0, lambda: self._bulk_import)
+        self._apply_profile()
+        self._migrate()
+        self._track_own_changes()
+
+    def _apply_profile(self):
+        for name in PROFILE_PRAGMAS:
+            if name in self.profile:
+                self.conn.execute(f"PRAGMA {name} = {self.profile[name]}")
+
+    def _migrate(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, script in enumerate(MIGRATIONS[version:], start=version + 1):
+            try:
+                self.conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {number};\nCOMMIT;")
+            except sqlite3.Error:
+                if self.conn.in_transaction:
+                    self.conn.rollback()
+                raise
+
+    def _track_own_changes(self):
+        # TEMP triggers only fire for this connection, so the window can skip its own writes
+        # (already patched in locally) when reading the shared change log.
+        self.conn.executescript("""
+            CREATE TEMP TABLE IF NOT EXISTS own_changes (seq INTEGER PRIMARY KEY);
+            CREATE TEMP TRIGGER IF NOT EXISTS own_changes_ai AFTER INSERT ON main.task_changes BEGIN
+                INSERT INTO own_changes (seq) VALUES (new.seq);
+            END;
+        """)
+
+    def _commit(self):
+        if not self._batch_depth:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        self._batch_depth += 1
+        ok = False
+        try:
+            yield self
+            ok = True
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                if ok:
+                    self.conn.commit()
+                else:
+                    self.conn.rollback()
+                    self.cache.clear()
+
+    def _check_data_version(self):
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self.cache.clear()
+            self._data_version = version
+
+    def _get_cached(self, task_id):
+        self._check_data_version()
+        row = self.cache.get(task_id)
+        if row is None:
+            row = self.conn.execute(f"SELECT {', '.join(DETAIL_COLUMNS)} FROM tasks WHERE id = ?",
+                                    (task_id,)).fetchone()
+            if row is not None:
+                self.cache.put(task_id, row)
+        return row
+
+    def get(self, task_id):
+        row = self._get_cached(task_id)
+        return row[:3] if row else None
+
+    def get_details(self, task_id):
+        row = self._get_cached(task_id)
+        return dict(zip(DETAIL_COLUMNS, row)) if row else None
+
+    def add_task(self, task_text, priority=0, due_date=None):
         cur = self.conn.cursor()
-        cur.execute("INSERT INTO tasks (task, status) VALUES (?, ?)", (task_text, "pending"))
-        self.conn.commit()
-        return cur.lastrowid
+        cur.execute("INSERT INTO tasks (task, status, priority, due_date) VALUES (?, ?, ?, ?)",
+                    (task_text, STATUS_PENDING, priority, due_date))
+        self._commit()
+        return (cur.lastrowid, task_text, STATUS_PENDING)
 
     def update_task(self, task_id, new_text):
-        self.conn.execute("UPDATE tasks SET task = ? WHERE id = ?", (new_text, task_id))
-        self.conn.commit()
+        self.cache.invalidate((task_id,))
+        self.conn.execute(f"UPDATE tasks SET task = ?, updated_at = {NOW_SQL} WHERE id = ?", (new_text, task_id))
+        self._commit()
+        return self.get(task_id)
+
+    def set_schedule(self, task_id, priority, due_date):
+        self.cache.invalidate((task_id,))
+        self.conn.execute(f"UPDATE tasks SET priority = ?, due_date = ?, updated_at = {NOW_SQL} WHERE id = ?",
+                          (priority, due_date, task_id))
+        self._commit()
+        return self.get_details(task_id)
 
     def delete_task(self, task_id):
+        row = self.get(task_id)
+        self.cache.invalidate((task_id,))
         self.conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-        self.conn.commit()
+        self._commit()
+        return row
 
     def toggle_status(self, task_id):
-        cur = self.conn.cursor()
-        cur.execute("SELECT status FROM tasks WHERE id = ?", (task_id,))
-        row = cur.fetchone()
-        if not row:
-            return
-        new_status = "done" if row[0] == "pending" else "pending"
-        cur.execute("UPDATE tasks SET status = ? WHERE id = ?", (new_status, task_id))
-        self.conn.commit()
+        self.cache.invalidate((task_id,))
+        rows = self.conn.execute(TOGGLE_SQL.format(where="id = ?"), (task_id,)).fetchall()
+        self._commit()
+        return rows[0] if rows else None
+
+    def toggle_many(self, task_ids):
+        task_ids = list(task_ids)
+        self.cache.invalidate(task_ids)
+        rows = []
+        for i in range(0, len(task_ids), MAX_SQL_PARAMS):
+            chunk = task_ids[i:i + MAX_SQL_PARAMS]
+            where = f"id IN ({','.join('?' * len(chunk))})"
+            rows.extend(self.conn.execute(TOGGLE_SQL.format(where=where), chunk).fetchall())
+        self._commit()
+        return rows
+
+    def add_many(self, task_texts):
+        cur = self.conn.executemany("INSERT INTO tasks (task) VALUES (?)",
+                                    ((text,) for text in task_texts))
+        self._commit()
+        return cur.rowcount
+
+    def delete_many(self, task_ids):
+        task_ids = list(task_ids)
+        self.cache.invalidate(task_ids)
+        cur = self.conn.executemany("DELETE FROM tasks WHERE id = ?", ((tid,) for tid in task_ids))
+        self._commit()
+        return cur.rowcount
+
+    def set_status_many(self, task_ids, status):
+        task_ids = list(task_ids)
+        self.cache.invalidate(task_ids)
+        status = status_code(status)
+        cur = self.conn.executemany(f"UPDATE tasks SET status = ?, updated_at = {NOW_SQL} WHERE id = ?",
+                                    ((status, tid) for tid in task_ids))
+        self._commit()
+        return cur.rowcount
+
+    def _select(self, query=None, status=None, before_id=None, after_id=None, limit=PAGE_SIZE, offset=0):
+        match = fts_query(query) if query else None
+        clauses, params = [], []
+        if match:
+            sql = "SELECT t.id, t.task, t.status FROM tasks_fts f JOIN tasks t ON t.id = f.rowid"
+            key = "f.rowid"
+            clauses.append("tasks_fts MATCH ?")
+            params.append(match)
+        else:
+            sql = "SELECT t.id, t.task, t.status FROM tasks t"
+            key = "t.id"
+        if status is not None:
+            clauses.append("t.status = ?")
+            params.append(status_code(status))
+        if before_id is not None:
+            clauses.append(f"{key} < ?")
+            params.append(before_id)
+        if after_id is not None:
+            clauses.append(f"{key} > ?")
+            params.append(after_id)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {key} {'ASC' if after_id is not None else 'DESC'} LIMIT ? OFFSET ?"
+        rows = self.conn.execute(sql, params + [limit, offset]).fetchall()
+        return rows[::-1] if after_id is not None else rows
+
+    def get_page(self, before_id=None, after_id=None, limit=PAGE_SIZE, query=None, status=None):
+        return self._select(query, status, before_id=before_id, after_id=after_id, limit=limit)
+
+    def search(self, query, status=None, limit=PAGE_SIZE, offset=0):
+        return self._select(query, status, limit=limit, offset=offset)
+
+    def get_sorted_page(self, order, after=None, limit=PAGE_SIZE):
+        column, direction = SORT_ORDERS[order]
+        clauses, params = [f"{column} IS NOT NULL"], []
+        if after is not None:
+            clauses.append(f"({column}, id) {'<' if direction == 'DESC' else '>'} (?, ?)")
+            params.extend(after)
+        sql = (f"SELECT id, task, status, {column} FROM tasks WHERE {' AND '.join(clauses)} "
+               f"ORDER BY {column} {direction}, id {direction} LIMIT ?")
+        return self.conn.execute(sql, params + [limit]).fetchall()
+
+    def _import_batch(self, batch):
+        # Skip the per-row FTS and change-log triggers; index the batch with one statement and log
+        # a single reload marker so other instances refresh once instead of replaying every row.
+        sql = "INSERT INTO tasks (task, status) SELECT ?, ? WHERE NOT EXISTS (SELECT 1 FROM tasks WHERE task = ?)"
+        with self.batch():
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN")
+            last_id = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()[0]
+            self._bulk_import = True
+            try:
+                inserted = self.conn.executemany(sql, batch).rowcount
+            finally:
+                self._bulk_import = False
+            self.conn.execute("INSERT INTO tasks_fts (rowid, task) SELECT id, task FROM tasks WHERE id > ?", (last_id,))
+            if inserted:
+                self.conn.execute("INSERT INTO task_changes (task_id, op) VALUES (0, ?)", (CHANGE_RELOAD,))
+        return inserted
+
+    def import_next(self, rows, batch_size=IMPORT_BATCH):
+        batch = [(task, status, task) for task, status in itertools.islice(rows, batch_size)]
+        return len(batch), self._import_batch(batch) if batch else 0
+
+    def import_rows(self, rows, batch_size=IMPORT_BATCH, progress=None):
+        rows = iter(rows)
+        seen = inserted = 0
+        while True:
+            count, added = self.import_next(rows, batch_size)
+            if not count:
+                return seen, inserted
+            seen += count
+            inserted += added
+            if progress:
+                progress(seen, inserted)
+
+    def last_change_seq(self):
+        self._feed_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM task_changes").fetchone()[0]
+
+    def changes_since(self, seq, limit=PAGE_SIZE):
+        # Read the head before data_version: a commit from another connection landing in between
+        # bumps data_version, so the fast path below never skips it.
+        head = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM task_changes").fetchone()[0]
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._feed_version:
+            return self._skip_own(head), [], False
+        self._feed_version = version
+        oldest = self.conn.execute("SELECT MIN(seq) FROM task_changes").fetchone()[0]
+        if oldest is not None and oldest > seq + 1:
+            return self._skip_own(head), [], True
+        rows = self.conn.execute(
+            "SELECT c.seq, c.op, c.task_id, t.id, t.task, t.status FROM task_changes c "
+            "LEFT JOIN tasks t ON t.id = c.task_id WHERE c.seq > ? AND c.seq <= ? "
+            "AND c.seq NOT IN (SELECT seq FROM temp.own_changes) ORDER BY c.seq LIMIT ?",
+            (seq, head, limit + 1)).fetchall()
+        if len(rows) > limit or any(r[1] == CHANGE_RELOAD for r in rows):
+            return self._skip_own(head), [], True
+        self.cache.invalidate(r[2] for r in rows)
+        changes = [(op, task_id, tuple(row) if row[0] is not None else None)
+                   for _, op, task_id, *row in rows]
+        return self._skip_own(head), changes, False
+
+    def _skip_own(self, head):
+        self.conn.execute("DELETE FROM temp.own_changes WHERE seq <= ?", (head,))
+        self._commit()
+        return head
+
+    def prune_changes(self, keep=CHANGE_LOG_KEEP):
+        self.conn.execute("DELETE FROM task_changes WHERE seq <= (SELECT MAX(seq) FROM task_changes) - ?", (keep,))
+        self._commit()
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def iter_batches(self, batch_size=EXPORT_BATCH):
+        cur = self.conn.execute("SELECT id, task, status FROM tasks ORDER BY id DESC")
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
 
     def get_all(self):
         cur = self.conn.cursor()
@@ -52,35 +470,183 @@ class TaskDB:
         return cur.fetchall()
 
     def close(self):
+        if not self.readonly:
+            try:
+                self.prune_changes()
+                self.conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
         self.conn.close()
 
+def format_txt_row(row):
+    tid, text, status = row
+    return f"{'[DONE]' if status==STATUS_DONE else '[PENDING]'} {text} (id:{tid})\n"
+
+def normalize_status(value):
+    done = str(value).strip().lower() in ("done", "[done]", "1", "true", "x", "✓")
+    return STATUS_DONE if done else STATUS_PENDING
+
+def iter_import_file(path):
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if ext == ".csv":
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return
+            lowered = [h.strip().lower() for h in header]
+            if "task" in lowered:
+                task_col = lowered.index("task")
+                status_col = lowered.index("status") if "status" in lowered else None
+            else:
+                task_col, status_col = 0, 1 if len(header) > 1 else None
+                reader = itertools.chain([header], reader)
+            for record in reader:
+                if len(record) <= task_col or not record[task_col].strip():
+                    continue
+                status = record[status_col] if status_col is not None and len(record) > status_col else ""
+                yield record[task_col].strip(), normalize_status(status)
+        elif ext == ".jsonl":
+            for line in f:
+                if line.strip():
+                    item = json.loads(line)
+                    text = str(item.get("task", "")).strip()
+                    if text:
+                        yield text, normalize_status(item.get("status", ""))
+        else:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                m = TXT_LINE_RE.match(line)
+                if m:
+                    yield m.group(2), normalize_status(m.group(1))
+                else:
+                    yield line, STATUS_PENDING
+
+def write_export(db, path, progress=None):
+    ext = os.path.splitext(path)[1].lower()
+    total = db.count()
+    done = 0
+    with open(path, "w", encoding="utf-8", newline="", buffering=EXPORT_BUFFER) as f:
+        if ext == ".csv":
+            writer = csv.writer(f)
+            writer.writerow(("id", "task", "status"))
+        for rows in db.iter_batches():
+            if ext == ".csv":
+                writer.writerows((tid, text, STATUS_NAMES[status]) for tid, text, status in rows)
+            elif ext == ".jsonl":
+                f.write("".join(json.dumps({"id": tid, "task": text, "status": STATUS_NAMES[status]}, ensure_ascii=False) + "\n"
+                                for tid, text, status in rows))
+            else:
+                f.write("".join(map(format_txt_row, rows)))
+            done += len(rows)
+            if progress:
+                progress(done, total)
+    return done
+
+class DBWorker:
+    def __init__(self, path=DB_PATH, profile=None, on_error=None):
+        self.path = path
+        self.on_error = on_error
+        self._requests = queue.Queue()
+        self._responses = queue.Queue()
+        self._thread = threading.Thread(target=self._run, args=(profile,), name="TaskDB", daemon=True)
+        self._thread.start()
+
+    def _run(self, profile):
+        try:
+            db = TaskDB(self.path, profile)
+        except Exception as e:
+            self._responses.put((self.on_error, (e,)))
+            return
+        try:
+            while True:
+                job = self._requests.get()
+                if job is None:
+                    break
+                op, args, kwargs, on_done, on_error = job
+                try:
+                    result = op(db, *args, **kwargs)
+                except Exception as e:
+                    self._responses.put((on_error or self.on_error, (e,)))
+                else:
+                    self._responses.put((on_done, (result,)))
+        finally:
+            db.close()
+
+    def submit(self, op, *args, on_done=None, on_error=None, **kwargs):
+        self._requests.put((op, args, kwargs, on_done, on_error))
+
+    def post(self, callback, *args):
+        self._responses.put((callback, args))
+
+    def dispatch(self, budget=DISPATCH_BUDGET):
+        deadline = time.perf_counter() + budget
+        while time.perf_counter() < deadline:
+            try:
+                callback, args = self._responses.get_nowait()
+            except queue.Empty:
+                return
+            if callback:
+                callback(*args)
+
+    def stop(self):
+        self._requests.put(None)
+        self._thread.join()
+
 class TodoApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("SQLite Todo App")
-        self.geometry("600x420")
+        self.geometry("600x460")
         self.resizable(False, False)
-        self.db = TaskDB()
+        self.worker = DBWorker(on_error=self._on_db_error)
+        self._generation = 0
+        self._current_rows = []
+        self._has_older = False
+        self._has_newer = False
+        self._page_pending = False
+        self._filter = (None, None)
+        self._search_job = None
+        self._export_thread = None
+        self._import = None
+        self._change_seq = None
+        self._sync_pending = False
         self._create_widgets()
         self._layout_widgets()
         self._bind_events()
         self.load_tasks()
+        self.after(POLL_MS, self._poll_worker)
+        self.after(SYNC_MS, self._sync_changes)
 
     def _create_widgets(self):
         self.top_frame = ttk.Frame(self, padding=8)
         self.task_var = tk.StringVar()
         self.entry = ttk.Entry(self.top_frame, textvariable=self.task_var, width=50)
         self.add_btn = ttk.Button(self.top_frame, text="Add Task", command=self.add_task)
+        self.search_frame = ttk.Frame(self, padding=(8,0,8,4))
+        self.search_label = ttk.Label(self.search_frame, text="Search:")
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(self.search_frame, textvariable=self.search_var, width=36)
+        self.filter_var = tk.StringVar(value=STATUS_FILTERS[0])
+        self.filter_combo = ttk.Combobox(self.search_frame, textvariable=self.filter_var, values=STATUS_FILTERS,
+                                         state="readonly", width=10)
         self.middle_frame = ttk.Frame(self, padding=(8,0))
         self.listbox = tk.Listbox(self.middle_frame, height=15, activestyle="none")
         self.scrollbar = ttk.Scrollbar(self.middle_frame, orient="vertical", command=self.listbox.yview)
-        self.listbox.config(yscrollcommand=self.scrollbar.set)
+        self.listbox.config(yscrollcommand=self._on_list_scroll)
         self.btn_frame = ttk.Frame(self.middle_frame, padding=(8,0))
         self.update_btn = ttk.Button(self.btn_frame, text="Edit Selected", command=self.edit_selected)
         self.delete_btn = ttk.Button(self.btn_frame, text="Delete Selected", command=self.delete_selected)
         self.toggle_btn = ttk.Button(self.btn_frame, text="Toggle Done/Undone", command=self.toggle_selected)
-        self.export_btn = ttk.Button(self.btn_frame, text="Export to .txt", command=self.export_tasks)
+        self.schedule_btn = ttk.Button(self.btn_frame, text="Priority/Due...", command=self.schedule_selected)
+        self.import_btn = ttk.Button(self.btn_frame, text="Import...", command=self.import_tasks)
+        self.export_btn = ttk.Button(self.btn_frame, text="Export...", command=self.export_tasks)
         self.refresh_btn = ttk.Button(self.btn_frame, text="Refresh", command=self.load_tasks)
+        self.multi_var = tk.BooleanVar(value=False)
+        self.multi_check = ttk.Checkbutton(self.btn_frame, text="Multi-select", variable=self.multi_var,
+                                           command=self.on_multi_toggle)
         self.status_var = tk.StringVar(value="Ready")
         self.status = ttk.Label(self, textvariable=self.status_var, relief="sunken", anchor="w", padding=4)
 
@@ -88,11 +654,16 @@ class TodoApp(tk.Tk):
         self.top_frame.pack(fill="x")
         self.entry.pack(side="left", padx=(0,8))
         self.add_btn.pack(side="left")
+        self.search_frame.pack(fill="x")
+        self.search_label.pack(side="left", padx=(0,4))
+        self.search_entry.pack(side="left", padx=(0,8))
+        self.filter_combo.pack(side="left")
         self.middle_frame.pack(fill="both", expand=True, padx=8, pady=(6,0))
         self.listbox.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="left", fill="y")
         self.btn_frame.pack(side="left", fill="y", padx=12)
-        for w in (self.update_btn, self.delete_btn, self.toggle_btn, self.export_btn, self.refresh_btn):
+        for w in (self.update_btn, self.delete_btn, self.toggle_btn, self.schedule_btn, self.import_btn, self.export_btn, self.refresh_btn,
+                  self.multi_check):
             w.pack(fill="x", pady=4)
         self.status.pack(side="bottom", fill="x")
 
@@ -100,37 +671,255 @@ class TodoApp(tk.Tk):
         self.listbox.bind("<<ListboxSelect>>", self.on_select)
         self.listbox.bind("<Double-Button-1>", self.on_double_click)
         self.bind("<Return>", lambda e: self.add_task())
+        self.search_entry.bind("<Return>", lambda e: (self.apply_filter(), "break")[1])
+        self.search_var.trace_add("write", lambda *a: self._schedule_search())
+        self.filter_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_filter())
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    def _poll_worker(self):
+        try:
+            self.worker.dispatch()
+        finally:
+            self.after(POLL_MS, self._poll_worker)
+
+    def _on_db_error(self, exc):
+        self._page_pending = False
+        self.status_var.set("Database error")
+        messagebox.showerror("Database error", str(exc), parent=self)
+
+    def _format_row(self, row):
+        tid, text, status = row
+        return f"[{'✓' if status==STATUS_DONE else ' '}] {text} (id:{tid})"
+
+    def _schedule_search(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DELAY_MS, self.apply_filter)
+
+    def apply_filter(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        self.load_tasks()
+
+    def _row_visible(self, row):
+        query, status = self._filter
+        if status is not None and row[2] != status:
+            return False
+        if query:
+            return fts_match(query, row[1])
+        return True
+
     def load_tasks(self):
+        query = self.search_var.get().strip() or None
+        status = self.filter_var.get()
+        self._filter = (query, STATUS_CODES.get(status))
+        self._generation += 1
+        self._page_pending = True
+        self.status_var.set("Loading...")
+        gen = self._generation
+        query, status = self._filter
+        self.worker.submit(lambda db: (db.last_change_seq(), db.get_page(query=query, status=status)),
+                           on_done=lambda result: self._on_loaded(gen, *result))
+
+    def _on_loaded(self, gen, seq, rows):
+        if gen != self._generation:
+            return
+        self._change_seq = seq
+        self._page_pending = False
         self.listbox.delete(0, tk.END)
-        rows = self.db.get_all()
-        for row in rows:
-            tid, text, status = row
-            display = f"[{'✓' if status=='done' else ' '}] {text} (id:{tid})"
-            self.listbox.insert(tk.END, display)
+        self._has_newer = False
+        self._has_older = len(rows) == PAGE_SIZE
+        if rows:
+            self.listbox.insert(tk.END, *map(self._format_row, rows))
         self._current_rows = rows
-        self.status_var.set(f"Loaded {len(rows)} tasks")
+        self.listbox.yview_moveto(0)
+        if self._filter == (None, None):
+            self.status_var.set(f"Loaded {len(rows)} tasks")
+        else:
+            more = "+" if self._has_older else ""
+            self.status_var.set(f"{len(rows)}{more} matching tasks")
+
+    def _patch_row(self, idx, row):
+        if not self._row_visible(row):
+            self._remove_row(idx)
+            return
+        selected = self.listbox.selection_includes(idx)
+        self.listbox.delete(idx)
+        self.listbox.insert(idx, self._format_row(row))
+        self._current_rows[idx] = row
+        if selected:
+            self.listbox.selection_set(idx)
+
+    def _remove_row(self, idx):
+        self.listbox.delete(idx)
+        del self._current_rows[idx]
+
+    def _find_index(self, task_id):
+        for idx, row in enumerate(self._current_rows):
+            if row[0] == task_id:
+                return idx
+        return None
+
+    def _patch_tasks(self, rows):
+        indexed = [(self._find_index(row[0]), row) for row in rows]
+        for idx, row in sorted((p for p in indexed if p[0] is not None), key=lambda p: p[0], reverse=True):
+            self._patch_row(idx, row)
+
+    def _remove_tasks(self, task_ids):
+        task_ids = set(task_ids)
+        for idx in range(len(self._current_rows) - 1, -1, -1):
+            if self._current_rows[idx][0] in task_ids:
+                self._remove_row(idx)
+
+    def _sync_changes(self):
+        if not self._sync_pending and self._change_seq is not None:
+            self._sync_pending = True
+            gen = self._generation
+            self.worker.submit(TaskDB.changes_since, self._change_seq,
+                               on_done=lambda result: self._on_changes(gen, *result),
+                               on_error=self._on_sync_failed)
+        self.after(SYNC_MS, self._sync_changes)
+
+    def _on_sync_failed(self, exc):
+        self._sync_pending = False
+        self.status_var.set(f"Sync failed: {exc}")
+
+    def _on_changes(self, gen, seq, changes, reload):
+        self._sync_pending = False
+        if gen != self._generation:
+            return
+        if reload:
+            self.load_tasks()
+            return
+        self._change_seq = seq
+        for op, task_id, row in changes:
+            if row is None:
+                self._remove_tasks([task_id])
+            else:
+                self._apply_remote_row(row)
+        if changes:
+            self.status_var.set(f"Synced {len(changes)} change(s)")
+
+    def _apply_remote_row(self, row):
+        idx = self._find_index(row[0])
+        if idx is not None:
+            self._patch_row(idx, row)
+            return
+        if not self._row_visible(row):
+            return
+        rows = self._current_rows
+        if rows and row[0] > rows[0][0] and self._has_newer:
+            return
+        if rows and row[0] < rows[-1][0] and self._has_older:
+            return
+        pos = next((i for i, r in enumerate(rows) if r[0] < row[0]), len(rows))
+        self.listbox.insert(pos, self._format_row(row))
+        rows.insert(pos, row)
+
+    def _insert_top_row(self, row):
+        if self._has_newer or not self._row_visible(row):
+            return
+        self.listbox.insert(0, self._format_row(row))
+        self._current_rows.insert(0, row)
+
+    def _on_list_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._page_pending:
+            return
+        if float(last) >= 1.0 - SCROLL_MARGIN and self._has_older:
+            self._page_pending = True
+            self.after_idle(self._page_older)
+        elif float(first) <= SCROLL_MARGIN and self._has_newer:
+            self._page_pending = True
+            self.after_idle(self._page_newer)
+
+    def _page_older(self):
+        if not self._current_rows:
+            self._page_pending = False
+            return
+        gen = self._generation
+        self.worker.submit(TaskDB.get_page, before_id=self._current_rows[-1][0], query=self._filter[0],
+                           status=self._filter[1], on_done=lambda rows: self._on_older(gen, rows))
+
+    def _on_older(self, gen, rows):
+        if gen != self._generation:
+            return
+        self._page_pending = False
+        self._has_older = len(rows) == PAGE_SIZE
+        if not rows:
+            return
+        self.listbox.insert(tk.END, *map(self._format_row, rows))
+        self._current_rows.extend(rows)
+        excess = len(self._current_rows) - PAGE_SIZE * WINDOW_PAGES
+        if excess > 0:
+            top = self.listbox.nearest(0)
+            self.listbox.delete(0, excess - 1)
+            del self._current_rows[:excess]
+            self.listbox.yview(max(top - excess, 0))
+            self._has_newer = True
+
+    def _page_newer(self):
+        if not self._current_rows:
+            self._page_pending = False
+            return
+        gen = self._generation
+        self.worker.submit(TaskDB.get_page, after_id=self._current_rows[0][0], query=self._filter[0],
+                           status=self._filter[1], on_done=lambda rows: self._on_newer(gen, rows))
+
+    def _on_newer(self, gen, rows):
+        if gen != self._generation:
+            return
+        self._page_pending = False
+        self._has_newer = len(rows) == PAGE_SIZE
+        if not rows:
+            return
+        top = self.listbox.nearest(0)
+        self.listbox.insert(0, *map(self._format_row, rows))
+        self._current_rows[:0] = rows
+        excess = len(self._current_rows) - PAGE_SIZE * WINDOW_PAGES
+        if excess > 0:
+            self.listbox.delete(len(self._current_rows) - excess, tk.END)
+            del self._current_rows[-excess:]
+            self._has_older = True
+        self.listbox.yview(top + len(rows))
 
     def add_task(self):
         text = self.task_var.get().strip()
         if not text:
             messagebox.showwarning("Input required", "Please enter a task.", parent=self)
             return
-        self.db.add_task(text)
         self.task_var.set("")
-        self.load_tasks()
+        self.worker.submit(TaskDB.add_task, text, on_done=self._on_added)
+
+    def _on_added(self, row):
+        self._insert_top_row(row)
+        self.status_var.set(f"Added id:{row[0]}")
 
     def get_selected_task(self):
-        sel = self.listbox.curselection()
-        if not sel:
-            return None
-        idx = sel[0]
-        try:
-            tid, text, status = self._current_rows[idx]
-            return {"id": tid, "task": text, "status": status, "index": idx}
-        except Exception:
-            return None
+        tasks = self.get_selected_tasks()
+        return tasks[0] if tasks else None
+
+    def get_selected_tasks(self):
+        tasks = []
+        for idx in self.listbox.curselection():
+            try:
+                tid, text, status = self._current_rows[idx]
+            except IndexError:
+                continue
+            tasks.append({"id": tid, "task": text, "status": status, "index": idx})
+        return tasks
+
+    def on_multi_toggle(self):
+        if self.multi_var.get():
+            self.listbox.config(selectmode="extended")
+            self.status_var.set("Multi-select on — Ctrl/Shift+click to select several tasks")
+        else:
+            sel = self.listbox.curselection()
+            self.listbox.config(selectmode="browse")
+            for idx in sel[1:]:
+                self.listbox.selection_clear(idx)
+            self.status_var.set("Multi-select off")
 
     def edit_selected(self):
         sel = self.get_selected_task()
@@ -144,51 +933,188 @@ class TodoApp(tk.Tk):
         if not new_text:
             messagebox.showwarning("Invalid", "Task cannot be empty.", parent=self)
             return
-        self.db.update_task(sel["id"], new_text)
-        self.load_tasks()
+        self.worker.submit(TaskDB.update_task, sel["id"], new_text, on_done=self._on_updated)
+
+    def _on_updated(self, row):
+        if row:
+            self._patch_tasks([row])
+            self.status_var.set(f"Updated id:{row[0]}")
 
     def delete_selected(self):
-        sel = self.get_selected_task()
-        if not sel:
+        tasks = self.get_selected_tasks()
+        if not tasks:
             messagebox.showinfo("No selection", "Please select a task to delete.", parent=self)
             return
-        ok = messagebox.askyesno("Confirm delete", f"Delete task:\n\n{sel['task']}\n\nThis action cannot be undone.", parent=self)
+        if len(tasks) == 1:
+            prompt = f"Delete task:\n\n{tasks[0]['task']}\n\nThis action cannot be undone."
+        else:
+            prompt = f"Delete {len(tasks)} selected tasks?\n\nThis action cannot be undone."
+        ok = messagebox.askyesno("Confirm delete", prompt, parent=self)
         if not ok:
             return
-        self.db.delete_task(sel["id"])
-        self.load_tasks()
+        ids = [t["id"] for t in tasks]
+        self.worker.submit(TaskDB.delete_many, ids, on_done=lambda count: self._on_deleted(ids, count))
+
+    def _on_deleted(self, task_ids, count):
+        self._remove_tasks(task_ids)
+        self.status_var.set(f"Deleted {count} task(s)")
 
     def toggle_selected(self):
+        tasks = self.get_selected_tasks()
+        if not tasks:
+            messagebox.showinfo("No selection", "Please select a task to toggle.", parent=self)
+            return
+        self.worker.submit(TaskDB.toggle_many, [t["id"] for t in tasks], on_done=self._on_toggled)
+
+    def _on_toggled(self, rows):
+        self._patch_tasks(rows)
+        if len(rows) == 1:
+            self.status_var.set(f"Selected id:{rows[0][0]} — {STATUS_NAMES[rows[0][2]]}")
+        else:
+            self.status_var.set(f"Toggled {len(rows)} task(s)")
+
+    def schedule_selected(self):
         sel = self.get_selected_task()
         if not sel:
-            messagebox.showinfo("No selection", "Please select a task to toggle.", parent=self)
+            messagebox.showinfo("No selection", "Please select a task to schedule.", parent=self)
             return
-        self.db.toggle_status(sel["id"])
+        self.worker.submit(TaskDB.get_details, sel["id"], on_done=self._prompt_schedule)
+
+    def _prompt_schedule(self, details):
+        if details is None:
+            return
+        priority = simpledialog.askinteger("Priority", "Priority (0 = none, 9 = highest):",
+                                           initialvalue=details["priority"], minvalue=0, maxvalue=9, parent=self)
+        if priority is None:
+            return
+        due = simpledialog.askstring("Due date", "Due date (YYYY-MM-DD, blank for none):",
+                                     initialvalue=details["due_date"] or "", parent=self)
+        if due is None:
+            return
+        due = due.strip() or None
+        if due:
+            try:
+                due = date.fromisoformat(due).isoformat()
+            except ValueError:
+                messagebox.showwarning("Invalid", "Due date must look like 2024-12-31.", parent=self)
+                return
+        self.worker.submit(TaskDB.set_schedule, details["id"], priority, due, on_done=self._on_details)
+
+    def _on_details(self, details):
+        sel = self.get_selected_task()
+        if not details or not sel or sel["id"] != details["id"]:
+            return
+        parts = [f"Selected id:{details['id']} — {STATUS_NAMES[details['status']]}"]
+        if details["priority"]:
+            parts.append(f"priority {details['priority']}")
+        if details["due_date"]:
+            parts.append(f"due {details['due_date']}")
+        self.status_var.set(" · ".join(parts))
+
+    def import_tasks(self):
+        if self._import is not None:
+            self.status_var.set("An import is already running")
+            return
+        path = filedialog.askopenfilename(filetypes=IMPORT_FILETYPES, title="Import tasks from...")
+        if not path:
+            self.status_var.set("Import cancelled")
+            return
+        self._import = {"path": path, "rows": iter_import_file(path), "seen": 0, "inserted": 0,
+                        "started": time.perf_counter()}
+        self.status_var.set(f"Importing {os.path.basename(path)}...")
+        self._import_next()
+
+    def _import_next(self):
+        # One job per batch, so paging, edits and sync queued meanwhile run between batches.
+        state = self._import
+        self.worker.submit(TaskDB.import_next, state["rows"],
+                           on_done=lambda result: self._on_import_batch(state, *result),
+                           on_error=self._on_import_failed)
+
+    def _import_rate(self, state):
+        elapsed = max(time.perf_counter() - state["started"], 1e-6)
+        return elapsed, state["seen"] / elapsed
+
+    def _on_import_batch(self, state, count, inserted):
+        if state is not self._import:
+            return
+        if not count:
+            self._on_imported(state)
+            return
+        state["seen"] += count
+        state["inserted"] += inserted
+        _, rate = self._import_rate(state)
+        self.status_var.set(f"Importing... {state['seen']} lines read, {state['inserted']} new ({rate:,.0f} lines/s)")
+        self._import_next()
+
+    def _on_imported(self, state):
+        elapsed, rate = self._import_rate(state)
+        self._import = None
         self.load_tasks()
+        self.status_var.set(f"Imported {state['inserted']} new of {state['seen']} lines from "
+                            f"{os.path.basename(state['path'])} in {elapsed:.1f}s ({rate:,.0f} lines/s)")
+
+    def _on_import_failed(self, exc):
+        state = self._import
+        self._import = None
+        if state is not None:
+            self.worker.submit(lambda db: state["rows"].close())
+        self.status_var.set("Import failed")
+        messagebox.showerror("Import failed", str(exc), parent=self)
 
     def export_tasks(self):
+        if self._export_thread is not None:
+            self.status_var.set("An export is already running")
+            return
         default_name = "tasks.txt"
         path = filedialog.asksaveasfilename(defaultextension=".txt", initialfile=default_name,
-                                            filetypes=[("Text files","*.txt"),("All files","*.*")],
+                                            filetypes=EXPORT_FILETYPES,
                                             title="Export tasks to...")
         if not path:
             self.status_var.set("Export cancelled")
             return
+        self._export_thread = threading.Thread(target=self._export_worker, args=(path,), daemon=True)
+        self._export_thread.start()
+        self.status_var.set(f"Exporting to {os.path.basename(path)}...")
+
+    def _export_worker(self, path):
+        progress = lambda done, total: self.worker.post(self._on_export_progress, done, total)
         try:
-            rows = self.db.get_all()
-            with open(path, "w", encoding="utf-8") as f:
-                for tid, text, status in rows:
-                    f.write(f"{'[DONE]' if status=='done' else '[PENDING]'} {text} (id:{tid})\n")
-            self.status_var.set(f"Exported {len(rows)} tasks to {os.path.basename(path)}")
-            messagebox.showinfo("Exported", f"Tasks exported to:\n{path}", parent=self)
+            db = TaskDB(self.worker.path, readonly=True)
+            try:
+                db.conn.execute("BEGIN")
+                count = write_export(db, path, progress)
+            finally:
+                db.close()
         except Exception as e:
-            messagebox.showerror("Export failed", str(e), parent=self)
+            self.worker.post(self._on_export_failed, e)
+        else:
+            self.worker.post(self._on_exported, count, path)
+
+    def _on_export_progress(self, done, total):
+        pct = 100 * done // total if total else 100
+        self.status_var.set(f"Exporting... {pct}% ({done}/{total})")
+
+    def _on_exported(self, count, path):
+        self._export_thread = None
+        self.status_var.set(f"Exported {count} tasks to {os.path.basename(path)}")
+        messagebox.showinfo("Exported", f"Tasks exported to:\n{path}", parent=self)
+
+    def _on_export_failed(self, exc):
+        self._export_thread = None
+        self.status_var.set("Export failed")
+        messagebox.showerror("Export failed", str(exc), parent=self)
 
     def on_select(self, event=None):
-        sel = self.get_selected_task()
+        tasks = self.get_selected_tasks()
+        if len(tasks) > 1:
+            self.status_var.set(f"{len(tasks)} tasks selected")
+            return
+        sel = tasks[0] if tasks else None
         if sel:
             self.task_var.set(sel["task"])
-            self.status_var.set(f"Selected id:{sel['id']} — {sel['status']}")
+            self.status_var.set(f"Selected id:{sel['id']} — {STATUS_NAMES[sel['status']]}")
+            self.worker.submit(TaskDB.get_details, sel["id"], on_done=self._on_details)
         else:
             self.status_var.set("Ready")
 
@@ -196,10 +1122,39 @@ class TodoApp(tk.Tk):
         self.toggle_selected()
 
     def on_close(self):
-        if messagebox.askokcancel("Quit", "Are you sure you want to quit?", parent=self):
-            self.db.close()
+        if self._import is not None:
+            prompt = ("An import is still running. Stop it and quit?\n"
+                      "Tasks imported so far will be kept.")
+        else:
+            prompt = "Are you sure you want to quit?"
+        if messagebox.askokcancel("Quit", prompt, parent=self):
+            if self._import is not None:
+                # Only the batch in flight finishes; no further batch is submitted.
+                rows = self._import["rows"]
+                self._import = None
+                self.worker.submit(lambda db: rows.close())
+                self.status_var.set("Stopping import...")
+                self.update_idletasks()
+            self.worker.stop()
             self.destroy()
 
+def benchmark(rows=1_000_000, inserts=2000):
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, profile in (("default", LEGACY_PROFILE), ("tuned", DEFAULT_PROFILE)):
+            db = TaskDB(os.path.join(tmp, f"{label}.db"), profile)
+            db.add_many(f"seed task {i}" for i in range(rows))
+            start = time.perf_counter()
+            for i in range(inserts):
+                db.add_task(f"bench task {i}")
+            results[label] = inserts / (time.perf_counter() - start)
+            db.close()
+            print(f"{label:>8}: {results[label]:,.0f} inserts/s over {rows:,} rows")
+        print(f"speedup: {results['tuned'] / results['default']:.1f}x")
+
 if __name__ == "__main__":
+    if "--bench" in sys.argv[1:]:
+        benchmark()
+        sys.exit(0)
     app = TodoApp()
     app.mainloop()